@@ -0,0 +1,290 @@
+"""Command line converter generating polygon nodes with coordinates in DMS format without QGIS GUI.
+
+Usage example:
+    python -m polygon_nodes_to_dms.cli sectors.gpkg airspaces.shp --format csv --output-dir nodes --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Sequence
+
+from qgis.core import (
+    QgsApplication,
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransformContext,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFields,
+    QgsVectorFileWriter,
+    QgsVectorLayer,
+    QgsWkbTypes
+)
+
+from .coordinate_format import DEFAULT_PRECISIONS, FORMAT_DMS, FORMATS, ORDER_XY, ORDER_YX
+from .crs_transform import wgs84_transform
+from .node_cache import NodeCache
+from .nodes import generate_node_features
+from .output_layer import (
+    FIELD_FEATURE_ID,
+    FIELD_FEATURE_IDS,
+    FIELD_LOD,
+    FIELD_NAME,
+    FIELD_PART,
+    FIELD_RING,
+    FIELD_VERTEX,
+    node_fields
+)
+
+OUTPUT_FORMATS = {
+    "csv": ".csv",
+    "geojson": ".geojson",
+    "gpkg": ".gpkg"
+}
+
+_QGIS_APP = None
+
+
+def init_qgis() -> None:
+    """Start QGIS application without GUI, once per process."""
+    global _QGIS_APP  # pylint: disable=global-statement
+    if _QGIS_APP is None:
+        _QGIS_APP = QgsApplication([], False)
+        _QGIS_APP.initQgis()
+
+
+class CsvNodesWriter:
+    """Write node features to CSV file with x, y columns. Columns are fixed, fields are not used."""
+
+    def __init__(self, path: str, fields: QgsFields):  # pylint: disable=unused-argument
+        self.file = open(path, "w", newline="", encoding="utf-8")  # pylint: disable=consider-using-with
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(
+            [FIELD_FEATURE_ID, FIELD_PART, FIELD_RING, FIELD_VERTEX, FIELD_FEATURE_IDS, FIELD_LOD, "x", "y", FIELD_NAME]
+        )
+
+    def write(self, feature: QgsFeature) -> None:
+        point = feature.geometry().constGet()
+        self.writer.writerow([
+            feature[FIELD_FEATURE_ID],
+            feature[FIELD_PART],
+            feature[FIELD_RING],
+            feature[FIELD_VERTEX],
+            feature[FIELD_FEATURE_IDS],
+            feature[FIELD_LOD],
+            repr(point.x()),
+            repr(point.y()),
+            feature[FIELD_NAME]
+        ])
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class GeoJsonNodesWriter:
+    """Write node features to GeoJSON file, feature collection is written incrementally."""
+
+    def __init__(self, path: str, fields: QgsFields):
+        self.file = open(path, "w", encoding="utf-8")  # pylint: disable=consider-using-with
+        self.file.write('{"type": "FeatureCollection", "features": [\n')
+        self.fields = fields
+        self.first = True
+
+    def write(self, feature: QgsFeature) -> None:
+        point = feature.geometry().constGet()
+        geojson_feature = {
+            "type": "Feature",
+            "geometry": {"type": "Point", "coordinates": [point.x(), point.y()]},
+            "properties": {name: feature[name] for name in self.fields.names()}
+        }
+        if not self.first:
+            self.file.write(",\n")
+        self.first = False
+        self.file.write(json.dumps(geojson_feature, ensure_ascii=False))
+
+    def close(self) -> None:
+        self.file.write("\n]}\n")
+        self.file.close()
+
+
+class GpkgNodesWriter:
+    """Write node features to GeoPackage file."""
+
+    def __init__(self, path: str, fields: QgsFields):
+        options = QgsVectorFileWriter.SaveVectorOptions()
+        options.driverName = "GPKG"
+        options.layerName = os.path.splitext(os.path.basename(path))[0]
+        self.writer = QgsVectorFileWriter.create(
+            path,
+            fields,
+            QgsWkbTypes.Point,
+            QgsCoordinateReferenceSystem("EPSG:4326"),
+            QgsCoordinateTransformContext(),
+            options
+        )
+        if self.writer.hasError() != QgsVectorFileWriter.NoError:
+            raise OSError(self.writer.errorMessage())
+
+    def write(self, feature: QgsFeature) -> None:
+        self.writer.addFeature(feature)
+
+    def close(self) -> None:
+        # Writer flushes and closes the file when deleted
+        del self.writer
+
+
+WRITERS = {
+    "csv": CsvNodesWriter,
+    "geojson": GeoJsonNodesWriter,
+    "gpkg": GpkgNodesWriter
+}
+
+
+def output_path(input_path: str, output_dir: str, output_format: str) -> str:
+    """Return output file path for the input file, e.g. sectors.gpkg -> <output_dir>/sectors_nodes_dms.csv."""
+    base_name = os.path.splitext(os.path.basename(input_path))[0]
+    return os.path.join(output_dir, f"{base_name}_nodes_dms{OUTPUT_FORMATS[output_format]}")
+
+
+def convert_file(input_path: str,
+                 output_file: str,
+                 output_format: str,
+                 coord_order: str,
+                 precision: int,
+                 merge_shared: bool = False,
+                 tolerance: float = 0.0,
+                 format_workers: int = 1,
+                 node_cache_path: str | None = None,
+                 coord_format: str = FORMAT_DMS) -> int:
+    """Generate nodes of all polygons from input file and write them to output file.
+    Features are read, converted and written one at a time, nodes are written in WGS84.
+
+    :param input_path: path to vector file with polygons/multipolygons
+    :param output_file: path to output file
+    :param output_format: one of OUTPUT_FORMATS
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param merge_shared: True if nodes shared by features are merged, all features are read before writing then
+    :param tolerance: nodes with x and y coordinates differing not more than tolerance are merged
+    :param format_workers: number of processes formatting coordinates of the file if shared nodes are not merged
+    :param node_cache_path: path to the SQLite cache of the generated nodes, nodes of unchanged features are read
+        from the cache; not used with merge_shared or format_workers
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :return: number of written nodes
+    """
+    init_qgis()
+    layer = QgsVectorLayer(input_path, "input", "ogr")
+    if not layer.isValid():
+        raise OSError(f"Can't open vector file: {input_path}")
+    if QgsWkbTypes.geometryType(layer.wkbType()) != QgsWkbTypes.PolygonGeometry:
+        raise ValueError(f"Layer is not type: Polygon, Multipolygon: {input_path}")
+
+    fields = node_fields()
+    transform = wgs84_transform(layer.crs(), QgsCoordinateTransformContext())
+    writer = WRITERS[output_format](output_file, fields)
+    node_cache = NodeCache(node_cache_path) if node_cache_path else None
+    nodes_count = 0
+    try:
+        if node_cache is not None:
+            node_cache.open()
+        features = layer.getFeatures(QgsFeatureRequest().setNoAttributes())
+        nodes = generate_node_features(
+            features, fields, coord_order, precision, merge_shared, tolerance,
+            transform=transform, workers=format_workers, node_cache=node_cache, source=layer.source(),
+            coord_format=coord_format
+        )
+        for node in nodes:
+            writer.write(node)
+            nodes_count += 1
+    finally:
+        writer.close()
+        if node_cache is not None:
+            node_cache.close()
+    return nodes_count
+
+
+def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(
+        prog="polygon_nodes_to_dms",
+        description="Generate polygon nodes with formatted coordinates."
+    )
+    parser.add_argument("inputs", nargs="+", help="vector files with polygons/multipolygons")
+    parser.add_argument("-o", "--output-dir", default=".", help="directory for output files (default: current)")
+    parser.add_argument("-f", "--format", choices=sorted(OUTPUT_FORMATS), default="csv", help="output format")
+    parser.add_argument("--order", choices=[ORDER_XY, ORDER_YX], default=ORDER_XY,
+                        help="coordinate order: XY - longitude, latitude; YX - latitude, longitude")
+    parser.add_argument("--coord-format", choices=FORMATS, default=FORMAT_DMS,
+                        help="coordinate format: DMS - degrees, minutes, seconds; DDM - degrees, decimal minutes; "
+                             "DD - decimal degrees; DDMMSS - compact DDMMSS.ssN DDDMMSS.ssE")
+    parser.add_argument("--precision", type=int,
+                        help="number of decimal places of seconds (DMS, DDMMSS), minutes (DDM) or degrees (DD), "
+                             "default depends on the coordinate format")
+    parser.add_argument("--merge-shared", action="store_true",
+                        help="write nodes shared by features and ring closing nodes once")
+    parser.add_argument("--tolerance", type=float, default=0.0,
+                        help="nodes with coordinates differing not more than tolerance are merged")
+    parser.add_argument("-w", "--workers", type=int, default=1,
+                        help="number of processes converting files in parallel")
+    parser.add_argument("--format-workers", type=int, default=1,
+                        help="number of processes formatting coordinates of one file, "
+                             "use for files with millions of nodes; not used with --merge-shared")
+    parser.add_argument("--cache", metavar="PATH",
+                        help="SQLite cache of generated nodes, nodes of unchanged polygons are read from the cache")
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Convert input files, return process exit code."""
+    args = parse_args(argv)
+    if args.precision is None:
+        args.precision = DEFAULT_PRECISIONS[args.coord_format]
+    os.makedirs(args.output_dir, exist_ok=True)
+    jobs = [
+        (
+            path,
+            output_path(path, args.output_dir, args.format),
+            args.format,
+            args.order,
+            args.precision,
+            args.merge_shared,
+            args.tolerance,
+            args.format_workers,
+            args.cache,
+            args.coord_format
+        )
+        for path in args.inputs
+    ]
+
+    exit_code = 0
+    if args.workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_qgis) as executor:
+            futures = [executor.submit(convert_file, *job) for job in jobs]
+            results = [(job, future.exception() or future.result()) for job, future in zip(jobs, futures)]
+    else:
+        results = []
+        for job in jobs:
+            try:
+                results.append((job, convert_file(*job)))
+            except Exception as e:  # pylint: disable=broad-except
+                # One bad input file does not stop converting the others, the same as with worker processes
+                results.append((job, e))
+
+    for (input_path, output_file, *_), result in results:
+        if isinstance(result, Exception):
+            print(f"{input_path}: {result}", file=sys.stderr)
+            exit_code = 1
+        else:
+            print(f"{input_path}: {result} nodes -> {output_file}")
+
+    if _QGIS_APP is not None:
+        _QGIS_APP.exitQgis()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
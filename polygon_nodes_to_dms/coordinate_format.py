@@ -0,0 +1,383 @@
+"""Formatting coordinates for whole coordinate arrays.
+
+DMS output is the same as output of QgsCoordinateFormatter.format with FormatDegreesMinutesSeconds format and default
+flags in the C locale, but all coordinates are formatted in one pass without creating QgsPointXY object for each
+of them. Output does not depend on the locale - decimal point is always "." and coordinates are separated by ",",
+QgsCoordinateFormatter uses locale decimal point and " " separator in locales with "," decimal point.
+Other formats: degrees, decimal minutes (DDM), decimal degrees (DD) and compact aeronautical format
+(DDMMSS.ssN DDDMMSS.ssE). Format, coordinate order and precision are compiled once into formatting function,
+see compile_format.
+"""
+from __future__ import annotations
+
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Callable, Sequence
+
+ORDER_XY = "XY"
+ORDER_YX = "YX"
+
+SEPARATOR = ","
+# Separator of latitude and longitude in compact format, e.g. 521500.00N 0213000.00E
+COMPACT_SEPARATOR = " "
+
+FORMAT_DMS = "DMS"
+FORMAT_DDM = "DDM"
+FORMAT_DD = "DD"
+FORMAT_COMPACT = "DDMMSS"
+FORMATS = (FORMAT_DMS, FORMAT_DDM, FORMAT_DD, FORMAT_COMPACT)
+# Decimal places of the last component: seconds for DMS and compact format, minutes for DDM, degrees for DD
+DEFAULT_PRECISIONS = {FORMAT_DMS: 3, FORMAT_DDM: 5, FORMAT_DD: 7, FORMAT_COMPACT: 2}
+
+DEGREE_SIGN = "°"
+MINUTE_SIGN = "′"
+SECOND_SIGN = "″"
+
+DEFAULT_CACHE_SIZE = 100000
+
+# Precomputed fragments for minutes and degrees
+_MINUTES = tuple(f"{m}{MINUTE_SIGN}" for m in range(61))
+_DEGREES = tuple(f"{d}{DEGREE_SIGN}" for d in range(182))
+
+
+def _round_half_away(value: float) -> float:
+    """Round non-negative value half away from zero - the same as C++ std::round."""
+    floor_value = math.floor(value)
+    return floor_value + 1 if value - floor_value >= 0.5 else floor_value
+
+
+def _dms_parts(value: float, precision_multiplier: float) -> tuple[int, int, float, float]:
+    """Split absolute value of the angle into degrees, minutes, seconds.
+
+    :param value: angle in decimal degrees
+    :param precision_multiplier: 10 to the power of seconds precision
+    :return: degrees, minutes, seconds, seconds rounded to the precision and multiplied by the precision_multiplier
+    """
+    abs_value = math.fabs(value)
+    degrees = int(abs_value)
+    float_minutes = (abs_value - degrees) * 60.0
+    minutes = int(float_minutes)
+    seconds = (float_minutes - minutes) * 60.0
+
+    rounded_seconds = _round_half_away(seconds * precision_multiplier)
+    # Make sure rounding to specified precision doesn't create seconds >= 60
+    if rounded_seconds >= 60 * precision_multiplier:
+        seconds = max(seconds - 60, 0.0)
+        rounded_seconds = _round_half_away(seconds * precision_multiplier)
+        minutes += 1
+        if minutes >= 60:
+            minutes -= 60
+            degrees += 1
+
+    return degrees, minutes, seconds, rounded_seconds
+
+
+def _wrap_longitude(value: float) -> float:
+    """Wrap longitude into -180, 180 range, e.g. 190 -> -170."""
+    wrapped = math.fmod(value, 360.0)
+    if wrapped > 180.0:
+        return wrapped - 360.0
+    if wrapped < -180.0:
+        return wrapped + 360.0
+    return wrapped
+
+
+def _wrap_latitude(value: float) -> float:
+    """Wrap latitude into -90, 90 range, e.g. 110 -> -70."""
+    wrapped = math.fmod(value, 180.0)
+    if wrapped > 90.0:
+        return wrapped - 180.0
+    if wrapped < -90.0:
+        return wrapped + 180.0
+    return wrapped
+
+
+def format_longitudes(values: Sequence[float], precision: int = 3) -> list[str]:
+    """Format longitudes in DMS format.
+
+    :param values: longitudes in decimal degrees
+    :param precision: number of decimal places of the last format component (seconds)
+    :return: formatted longitudes
+    """
+    precision_multiplier = math.pow(10.0, precision)
+    seconds_template = f"{{:.{precision}f}}{SECOND_SIGN}"
+    result = []
+    for value in values:
+        wrapped = _wrap_longitude(value)
+        degrees, minutes, seconds, rounded_seconds = _dms_parts(wrapped, precision_multiplier)
+        hemisphere = "W" if wrapped < 0 else "E"
+        # No hemisphere letter for 0 and 180 degrees longitude
+        if minutes == 0 and rounded_seconds == 0 and degrees in (0, 180):
+            hemisphere = ""
+        result.append(_DEGREES[degrees] + _MINUTES[minutes] + seconds_template.format(seconds) + hemisphere)
+    return result
+
+
+def format_latitudes(values: Sequence[float], precision: int = 3) -> list[str]:
+    """Format latitudes in DMS format.
+
+    :param values: latitudes in decimal degrees
+    :param precision: number of decimal places of the last format component (seconds)
+    :return: formatted latitudes
+    """
+    precision_multiplier = math.pow(10.0, precision)
+    seconds_template = f"{{:.{precision}f}}{SECOND_SIGN}"
+    result = []
+    for value in values:
+        wrapped = _wrap_latitude(value)
+        degrees, minutes, seconds, rounded_seconds = _dms_parts(wrapped, precision_multiplier)
+        hemisphere = "S" if wrapped < 0 else "N"
+        # No hemisphere letter for equator
+        if degrees == 0 and minutes == 0 and rounded_seconds == 0:
+            hemisphere = ""
+        result.append(_DEGREES[degrees] + _MINUTES[minutes] + seconds_template.format(seconds) + hemisphere)
+    return result
+
+
+def format_dms(xs: Sequence[float], ys: Sequence[float], order: str = ORDER_XY, precision: int = 3) -> list[str]:
+    """Format pairs of coordinates in DMS format, e.g. 21°0′30.000″E,52°15′0.000″N.
+    Output is the same as QgsCoordinateFormatter output in the C locale, see module description.
+
+    :param xs: longitudes in decimal degrees
+    :param ys: latitudes in decimal degrees
+    :param order: ORDER_XY for longitude, latitude order, ORDER_YX for latitude, longitude order
+    :param precision: number of decimal places of the last format component (seconds)
+    :return: formatted coordinates
+    """
+    longitudes = format_longitudes(xs, precision)
+    latitudes = format_latitudes(ys, precision)
+    if order == ORDER_YX:
+        return [lat + SEPARATOR + lon for lon, lat in zip(longitudes, latitudes)]
+    return [lon + SEPARATOR + lat for lon, lat in zip(longitudes, latitudes)]
+
+
+def _format_ddm(values: Sequence[float],
+                precision: int,
+                wrap: Callable[[float], float],
+                hemispheres: tuple[str, str],
+                is_unsigned: Callable[[int, int, float], bool]) -> list[str]:
+    """Format angles in degrees, decimal minutes format, e.g. 21°30.00000′E.
+
+    :param values: angles in decimal degrees
+    :param precision: number of decimal places of the last format component (minutes)
+    :param wrap: function wrapping angle into valid range
+    :param hemispheres: hemisphere letters of the positive and negative angles
+    :param is_unsigned: function checking if degrees, rounded minutes are without hemisphere letter
+    """
+    precision_multiplier = math.pow(10.0, precision)
+    minutes_template = f"{{:.{precision}f}}{MINUTE_SIGN}"
+    result = []
+    for value in values:
+        wrapped = wrap(value)
+        abs_value = math.fabs(wrapped)
+        degrees = int(abs_value)
+        minutes = (abs_value - degrees) * 60.0
+        rounded_minutes = _round_half_away(minutes * precision_multiplier)
+        if rounded_minutes >= 60 * precision_multiplier:
+            minutes = max(minutes - 60, 0.0)
+            rounded_minutes = _round_half_away(minutes * precision_multiplier)
+            degrees += 1
+        hemisphere = "" if is_unsigned(degrees, rounded_minutes) else hemispheres[wrapped < 0]
+        result.append(_DEGREES[degrees] + minutes_template.format(minutes) + hemisphere)
+    return result
+
+
+def _format_dd(values: Sequence[float],
+               precision: int,
+               wrap: Callable[[float], float],
+               hemispheres: tuple[str, str],
+               unsigned_values: tuple[str, ...]) -> list[str]:
+    """Format angles in decimal degrees format, e.g. 21.5000000°E.
+
+    :param values: angles in decimal degrees
+    :param precision: number of decimal places of the last format component (degrees)
+    :param wrap: function wrapping angle into valid range
+    :param hemispheres: hemisphere letters of the positive and negative angles
+    :param unsigned_values: formatted absolute values without hemisphere letter, e.g. 0.00°
+    """
+    template = f"{{:.{precision}f}}{DEGREE_SIGN}"
+    result = []
+    for value in values:
+        wrapped = wrap(value)
+        formatted = template.format(math.fabs(wrapped))
+        result.append(formatted if formatted in unsigned_values else formatted + hemispheres[wrapped < 0])
+    return result
+
+
+def _format_compact(values: Sequence[float],
+                    precision: int,
+                    wrap: Callable[[float], float],
+                    hemispheres: tuple[str, str],
+                    degrees_digits: int) -> list[str]:
+    """Format angles in compact aeronautical format, e.g. 0213000.00E, 521500.00N.
+
+    :param values: angles in decimal degrees
+    :param precision: number of decimal places of the last format component (seconds)
+    :param wrap: function wrapping angle into valid range
+    :param hemispheres: hemisphere letters of the positive and negative angles
+    :param degrees_digits: number of degrees digits, 3 for longitude, 2 for latitude
+    """
+    precision_multiplier = math.pow(10.0, precision)
+    seconds_width = precision + 3 if precision else 2
+    template = f"{{:0{degrees_digits}d}}{{:02d}}{{:0{seconds_width}.{precision}f}}{{}}"
+    result = []
+    for value in values:
+        wrapped = wrap(value)
+        degrees, minutes, seconds, _ = _dms_parts(wrapped, precision_multiplier)
+        result.append(template.format(degrees, minutes, seconds, hemispheres[wrapped < 0]))
+    return result
+
+
+def _axis_formatters(coord_format: str,
+                     precision: int) -> tuple[Callable[[Sequence[float]], list[str]],
+                                              Callable[[Sequence[float]], list[str]],
+                                              str]:
+    """Return longitudes formatting function, latitudes formatting function and separator of the format."""
+    if coord_format == FORMAT_DMS:
+        return (
+            lambda values: format_longitudes(values, precision),
+            lambda values: format_latitudes(values, precision),
+            SEPARATOR
+        )
+    if coord_format == FORMAT_DDM:
+        return (
+            lambda values: _format_ddm(
+                values, precision, _wrap_longitude, ("E", "W"),
+                lambda degrees, minutes: minutes == 0 and degrees in (0, 180)
+            ),
+            lambda values: _format_ddm(
+                values, precision, _wrap_latitude, ("N", "S"),
+                lambda degrees, minutes: minutes == 0 and degrees == 0
+            ),
+            SEPARATOR
+        )
+    if coord_format == FORMAT_DD:
+        zero = f"{0:.{precision}f}{DEGREE_SIGN}"
+        antimeridian = f"{180:.{precision}f}{DEGREE_SIGN}"
+        return (
+            lambda values: _format_dd(values, precision, _wrap_longitude, ("E", "W"), (zero, antimeridian)),
+            lambda values: _format_dd(values, precision, _wrap_latitude, ("N", "S"), (zero,)),
+            SEPARATOR
+        )
+    if coord_format == FORMAT_COMPACT:
+        return (
+            lambda values: _format_compact(values, precision, _wrap_longitude, ("E", "W"), 3),
+            lambda values: _format_compact(values, precision, _wrap_latitude, ("N", "S"), 2),
+            COMPACT_SEPARATOR
+        )
+    raise ValueError(f"Unknown coordinate format: {coord_format}")
+
+
+@lru_cache(maxsize=None)
+def compile_format(coord_format: str = FORMAT_DMS,
+                   order: str = ORDER_XY,
+                   precision: int = 3) -> Callable[[Sequence[float], Sequence[float]], list[str]]:
+    """Return function formatting pairs of coordinates in the given format, order and precision.
+    Templates of the format are built once, compiled functions are reused.
+
+    :param coord_format: one of FORMATS
+    :param order: ORDER_XY for longitude, latitude order, ORDER_YX for latitude, longitude order
+    :param precision: number of decimal places of the last format component, see DEFAULT_PRECISIONS
+    :return: function formatting longitudes, latitudes arrays
+    """
+    format_lons, format_lats, separator = _axis_formatters(coord_format, precision)
+    if order == ORDER_YX:
+        def format_pairs(xs: Sequence[float], ys: Sequence[float]) -> list[str]:
+            return [lat + separator + lon for lon, lat in zip(format_lons(xs), format_lats(ys))]
+    else:
+        def format_pairs(xs: Sequence[float], ys: Sequence[float]) -> list[str]:
+            return [lon + separator + lat for lon, lat in zip(format_lons(xs), format_lats(ys))]
+    return format_pairs
+
+
+def format_coordinates(xs: Sequence[float],
+                       ys: Sequence[float],
+                       order: str = ORDER_XY,
+                       precision: int = 3,
+                       coord_format: str = FORMAT_DMS) -> list[str]:
+    """Format pairs of coordinates in the given format, see compile_format.
+
+    :param xs: longitudes in decimal degrees
+    :param ys: latitudes in decimal degrees
+    :param order: ORDER_XY for longitude, latitude order, ORDER_YX for latitude, longitude order
+    :param precision: number of decimal places of the last format component
+    :param coord_format: one of FORMATS
+    :return: formatted coordinates
+    """
+    return compile_format(coord_format, order, precision)(xs, ys)
+
+
+class DMSCache:
+    """Bounded LRU cache of formatted coordinates.
+
+    Coordinates are quantized to 1/100 of the smallest formatted seconds fraction before lookup,
+    so coordinates differing less than that share formatted string. Cache can be used from many threads.
+    Arrays with more coordinates than the cache size are formatted without the cache - they would evict
+    all cached coordinates before any of them is used again.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """
+        :param maxsize: maximum number of cached formatted coordinates, 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def clear(self) -> None:
+        """Remove all cached strings and reset hit/miss counters."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def format_dms(self,
+                   xs: Sequence[float],
+                   ys: Sequence[float],
+                   order: str = ORDER_XY,
+                   precision: int = 3,
+                   coord_format: str = FORMAT_DMS) -> list[str]:
+        """Format pairs of coordinates, only coordinates not found in the cache are formatted.
+        See format_coordinates for parameters description.
+        """
+        if len(xs) > self.maxsize:
+            with self._lock:
+                self.misses += len(xs)
+            return format_coordinates(xs, ys, order, precision, coord_format)
+
+        resolution = 3600 * 10 ** (precision + 2)
+        keys = [(round(x * resolution), round(y * resolution), order, precision, coord_format) for x, y in zip(xs, ys)]
+        result = [None] * len(keys)
+        missing = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                dms = self._cache.get(key)
+                if dms is None:
+                    missing.append(i)
+                else:
+                    self._cache.move_to_end(key)
+                    result[i] = dms
+            self.hits += len(keys) - len(missing)
+            self.misses += len(missing)
+
+        if not missing:
+            return result
+
+        formatted = format_coordinates(
+            [xs[i] for i in missing], [ys[i] for i in missing], order, precision, coord_format
+        )
+        with self._lock:
+            for i, dms in zip(missing, formatted):
+                result[i] = dms
+                if self.maxsize:
+                    self._cache[keys[i]] = dms
+            while len(self._cache) > self.maxsize:
+                self._cache.popitem(last=False)
+        return result
@@ -0,0 +1,74 @@
+"""Transformation of the source geometries to WGS84 - coordinates are always formatted in WGS84."""
+from __future__ import annotations
+
+import threading
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsCoordinateTransform,
+    QgsCoordinateTransformContext,
+    QgsGeometry
+)
+
+WGS84 = QgsCoordinateReferenceSystem("EPSG:4326")
+
+
+class WGS84TransformCache:
+    """Cache of transformations to WGS84 per source CRS and transform context. Cache can be used from many threads,
+    returned transformations should be copied before using them in other thread.
+    """
+
+    def __init__(self):
+        self._transforms = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(src_crs: QgsCoordinateReferenceSystem, context: QgsCoordinateTransformContext) -> tuple[str, str]:
+        """Return cache key of the source CRS and transform context."""
+        operations = sorted(context.coordinateOperations().items())
+        return src_crs.toWkt(), repr(operations)
+
+    def get(self,
+            src_crs: QgsCoordinateReferenceSystem,
+            context: QgsCoordinateTransformContext) -> QgsCoordinateTransform | None:
+        """Return transformation from source CRS to WGS84.
+
+        :param src_crs: source CRS
+        :param context: transform context, e.g. of the project
+        :return: transformation, None if source CRS is WGS84 or is not valid - geometries are not transformed then
+        """
+        if not src_crs.isValid() or src_crs == WGS84:
+            return None
+        key = self._key(src_crs, context)
+        with self._lock:
+            transform = self._transforms.get(key)
+            if transform is None:
+                transform = QgsCoordinateTransform(src_crs, WGS84, context)
+                self._transforms[key] = transform
+        return QgsCoordinateTransform(transform)
+
+    def clear(self) -> None:
+        """Remove all cached transformations."""
+        with self._lock:
+            self._transforms.clear()
+
+
+_TRANSFORM_CACHE = WGS84TransformCache()
+
+
+def wgs84_transform(src_crs: QgsCoordinateReferenceSystem,
+                    context: QgsCoordinateTransformContext) -> QgsCoordinateTransform | None:
+    """Return copy of the cached transformation from source CRS to WGS84, see WGS84TransformCache.get."""
+    return _TRANSFORM_CACHE.get(src_crs, context)
+
+
+def to_wgs84(geom: QgsGeometry, transform: QgsCoordinateTransform | None) -> QgsGeometry:
+    """Transform all coordinates of the geometry to WGS84 at once.
+
+    :param geom: geometry in source CRS, transformed in place
+    :param transform: transformation to WGS84, geometry is not transformed if None
+    :return: geometry in WGS84
+    """
+    if transform is not None:
+        geom.transform(transform)
+    return geom
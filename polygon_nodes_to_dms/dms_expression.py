@@ -0,0 +1,152 @@
+"""Expression functions formatting coordinates and style labeling polygon nodes at render time."""
+from __future__ import annotations
+
+from qgis.core import (
+    QgsExpression,
+    QgsFontMarkerSymbolLayer,
+    QgsGeometryGeneratorSymbolLayer,
+    QgsMarkerSymbol,
+    QgsProperty,
+    QgsRenderContext,
+    QgsSymbol,
+    QgsSymbolLayer,
+    QgsVectorLayer,
+    qgsfunction
+)
+from qgis.PyQt.QtCore import QPointF
+
+from .coordinate_format import FORMAT_DMS, DMSCache
+
+FUNCTION_NAME = "dms_format"
+FORMAT_FUNCTION_NAME = "format_coordinates"
+# Geometry generator of the polygon nodes, ring closing nodes are skipped
+NODES_EXPRESSION = "nodes_to_points($geometry, true)"
+
+# Shared by all render threads, cache is thread safe
+_CACHE = DMSCache()
+
+
+@qgsfunction(args="auto", group="PolygonNodesToDMS", referenced_columns=[], register=False)
+def dms_format(x, y, order, precision, feature, parent):  # pylint: disable=unused-argument
+    """
+    Returns coordinates formatted in DMS format.
+    <h4>Syntax</h4>
+    <p>dms_format(x, y, order, precision)</p>
+    <h4>Arguments</h4>
+    <p>x - longitude in decimal degrees<br/>
+    y - latitude in decimal degrees<br/>
+    order - 'XY' for longitude, latitude order, 'YX' for latitude, longitude order<br/>
+    precision - number of decimal places of the last format component (seconds)</p>
+    <h4>Example</h4>
+    <p>dms_format(21.5, 52.25, 'YX', 3) &rarr; '52°15′0.000″N,21°30′0.000″E'</p>
+    """
+    if x is None or y is None:
+        return None
+    return _CACHE.format_dms([x], [y], order, int(precision))[0]
+
+
+@qgsfunction(args="auto", group="PolygonNodesToDMS", referenced_columns=[], register=False)
+def format_coordinates(x, y, coord_format, order, precision, feature, parent):  # pylint: disable=unused-argument
+    """
+    Returns coordinates formatted in the given format.
+    <h4>Syntax</h4>
+    <p>format_coordinates(x, y, format, order, precision)</p>
+    <h4>Arguments</h4>
+    <p>x - longitude in decimal degrees<br/>
+    y - latitude in decimal degrees<br/>
+    format - 'DMS' degrees, minutes, seconds, 'DDM' degrees, decimal minutes, 'DD' decimal degrees,
+    'DDMMSS' compact DDMMSS.ssN DDDMMSS.ssE format<br/>
+    order - 'XY' for longitude, latitude order, 'YX' for latitude, longitude order<br/>
+    precision - number of decimal places of seconds (DMS, DDMMSS), minutes (DDM) or degrees (DD)</p>
+    <h4>Example</h4>
+    <p>format_coordinates(21.5, 52.25, 'DDMMSS', 'YX', 2) &rarr; '521500.00N 0213000.00E'</p>
+    """
+    if x is None or y is None:
+        return None
+    try:
+        return _CACHE.format_dms([x], [y], order, int(precision), coord_format)[0]
+    except ValueError as error:
+        parent.setEvalErrorString(str(error))
+        return None
+
+
+def register() -> None:
+    """Register dms_format and format_coordinates expression functions."""
+    if not QgsExpression.isFunctionName(FUNCTION_NAME):
+        QgsExpression.registerFunction(dms_format)
+    if not QgsExpression.isFunctionName(FORMAT_FUNCTION_NAME):
+        QgsExpression.registerFunction(format_coordinates)
+
+
+def unregister() -> None:
+    """Unregister expression functions and clear their cache."""
+    QgsExpression.unregisterFunction(FUNCTION_NAME)
+    QgsExpression.unregisterFunction(FORMAT_FUNCTION_NAME)
+    _CACHE.clear()
+
+
+def node_labels_symbol_layer(coord_order: str,
+                             precision: int = 3,
+                             coord_format: str = FORMAT_DMS) -> QgsGeometryGeneratorSymbolLayer:
+    """Create symbol layer drawing polygon nodes with their formatted coordinates.
+    Nodes are generated at render time by geometry generator, each node is drawn as point marker and text marker
+    with its coordinates transformed from the layer CRS to WGS84 and formatted.
+
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :return: geometry generator symbol layer
+    """
+    generator = QgsGeometryGeneratorSymbolLayer.create({"geometryModifier": NODES_EXPRESSION})
+    generator.setSymbolType(QgsSymbol.Marker)
+
+    text_layer = QgsFontMarkerSymbolLayer()
+    text_layer.setHorizontalAnchorPoint(QgsFontMarkerSymbolLayer.Left)
+    text_layer.setOffset(QPointF(2, 0))
+    text_layer.setDataDefinedProperty(
+        QgsSymbolLayer.PropertyCharacter,
+        QgsProperty.fromExpression(
+            f"with_variable('node', transform(geometry_n($geometry, @geometry_part_num), @layer_crs, 'EPSG:4326'), "
+            f"{FORMAT_FUNCTION_NAME}(x(@node), y(@node), '{coord_format}', '{coord_order}', {precision}))"
+        )
+    )
+    node_symbol = QgsMarkerSymbol()
+    node_symbol.setSize(1.5)
+    node_symbol.appendSymbolLayer(text_layer)
+    generator.setSubSymbol(node_symbol)
+    return generator
+
+
+def _is_node_labels_symbol_layer(symbol_layer: QgsSymbolLayer) -> bool:
+    """Check if symbol layer was created by node_labels_symbol_layer."""
+    return (
+        isinstance(symbol_layer, QgsGeometryGeneratorSymbolLayer)
+        and symbol_layer.geometryExpression() == NODES_EXPRESSION
+    )
+
+
+def remove_node_labels_style(layer: QgsVectorLayer) -> None:
+    """Remove node labels symbol layers from all symbols of the layer renderer."""
+    for symbol in layer.renderer().symbols(QgsRenderContext()):
+        for index in reversed(range(symbol.symbolLayerCount())):
+            if _is_node_labels_symbol_layer(symbol.symbolLayer(index)):
+                symbol.deleteSymbolLayer(index)
+    layer.triggerRepaint()
+
+
+def apply_node_labels_style(layer: QgsVectorLayer,
+                            coord_order: str,
+                            precision: int = 3,
+                            coord_format: str = FORMAT_DMS) -> None:
+    """Label nodes of the polygon layer with their coordinates at render time, without creating nodes layer.
+    Node labels symbol layer is added to all symbols of the layer renderer, previously added one is replaced.
+
+    :param layer: polygon layer
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    """
+    remove_node_labels_style(layer)
+    for symbol in layer.renderer().symbols(QgsRenderContext()):
+        symbol.appendSymbolLayer(node_labels_symbol_layer(coord_order, precision, coord_format))
+    layer.triggerRepaint()
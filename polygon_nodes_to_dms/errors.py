@@ -13,5 +13,5 @@ class LayerNotPolygonMultiPolygonError(NodesToDMSBaseError):
     """Risen when active layer is not Polygon or MultiPolygon type."""
 
 
-class OneFeatureNotSelectedError(NodesToDMSBaseError):
-    """Risen when active layers has no or more than 1 selected features."""
+class FeatureNotSelectedError(NodesToDMSBaseError):
+    """Risen when active layer has no selected features."""
@@ -0,0 +1,49 @@
+"""Output layer label rendering settings stored in the QGIS project."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from qgis.core import QgsProject
+
+SCOPE = "PolygonNodesToDMS"
+
+
+@dataclass
+class LabelSettings:
+    """Label rendering budget of the output layer."""
+
+    # Labels are shown only between min_scale (most zoomed out) and max_scale (most zoomed in)
+    scale_visibility: bool = False
+    min_scale: int = 100000
+    max_scale: int = 0
+    # Maximum number of labels rendered on the map
+    limit_labels: bool = False
+    max_labels: int = 2000
+    # Label placed over the node - one candidate position instead of positions around the node
+    cheap_placement: bool = False
+    # Only nodes significant at the current map scale are rendered
+    level_of_detail: bool = False
+
+    @classmethod
+    def read(cls, project: QgsProject) -> LabelSettings:
+        """Read label settings from the project, default values are used for settings not stored in the project."""
+        defaults = cls()
+        return cls(
+            scale_visibility=project.readBoolEntry(SCOPE, "labels/scale_visibility", defaults.scale_visibility)[0],
+            min_scale=project.readNumEntry(SCOPE, "labels/min_scale", defaults.min_scale)[0],
+            max_scale=project.readNumEntry(SCOPE, "labels/max_scale", defaults.max_scale)[0],
+            limit_labels=project.readBoolEntry(SCOPE, "labels/limit_labels", defaults.limit_labels)[0],
+            max_labels=project.readNumEntry(SCOPE, "labels/max_labels", defaults.max_labels)[0],
+            cheap_placement=project.readBoolEntry(SCOPE, "labels/cheap_placement", defaults.cheap_placement)[0],
+            level_of_detail=project.readBoolEntry(SCOPE, "labels/level_of_detail", defaults.level_of_detail)[0]
+        )
+
+    def write(self, project: QgsProject) -> None:
+        """Store label settings in the project."""
+        project.writeEntryBool(SCOPE, "labels/scale_visibility", self.scale_visibility)
+        project.writeEntry(SCOPE, "labels/min_scale", self.min_scale)
+        project.writeEntry(SCOPE, "labels/max_scale", self.max_scale)
+        project.writeEntryBool(SCOPE, "labels/limit_labels", self.limit_labels)
+        project.writeEntry(SCOPE, "labels/max_labels", self.max_labels)
+        project.writeEntryBool(SCOPE, "labels/cheap_placement", self.cheap_placement)
+        project.writeEntryBool(SCOPE, "labels/level_of_detail", self.level_of_detail)
@@ -0,0 +1,157 @@
+"""Updating output layer nodes following geometry edits of the source layer."""
+from __future__ import annotations
+
+from qgis.core import (
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsPoint,
+    QgsProject,
+    QgsVectorLayer
+)
+
+from .coordinate_format import FORMAT_DMS, DMSCache
+from .crs_transform import to_wgs84, wgs84_transform
+from .nodes import Node, coordinates_formatter, geometry_nodes, node_attributes
+from .output_layer import FIELD_FEATURE_ID, FIELD_LOD, FIELD_NAME, FIELD_PART, FIELD_RING, FIELD_VERTEX, OutputLayer
+
+
+class LiveNodesUpdater:
+    """Patch output layer node features when geometries of the source features are changed or features are deleted.
+    Only nodes of the source features which nodes are already in the output layer are updated.
+    Moved nodes are reformatted and changed in place keeping their importance level,
+    nodes are regenerated only when number of nodes changes.
+    """
+
+    def __init__(self,
+                 src_layer: QgsVectorLayer,
+                 output_layer: OutputLayer,
+                 coord_order: str,
+                 precision: int = 3,
+                 cache: DMSCache | None = None,
+                 coord_format: str = FORMAT_DMS,
+                 with_levels: bool = True):
+        """
+        :param src_layer: source polygon layer
+        :param output_layer: output layer with nodes of the src_layer features
+        :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+        :param precision: number of decimal places of the last format component
+        :param cache: cache of formatted coordinates
+        :param coord_format: coordinate format, one of coordinate_format.FORMATS
+        :param with_levels: False if importance levels are not needed, regenerated nodes get level 0
+        """
+        self.src_layer = src_layer
+        self.output_layer = output_layer
+        self.format_func = coordinates_formatter(coord_order, precision, coord_format, cache)
+        self.with_levels = with_levels
+        self.transform = wgs84_transform(src_layer.crs(), QgsProject.instance().transformContext())
+        # Source feature id -> list of (node feature id, Node) in the order of the source feature nodes
+        self.nodes = {}
+        self._index_output_nodes()
+        self.src_layer.geometryChanged.connect(self.on_geometry_changed)
+        self.src_layer.featureDeleted.connect(self.on_feature_deleted)
+        self.src_layer.willBeDeleted.connect(self.stop)
+        # Output layer removed from the project, stop is safe to call again
+        self.output_layer.layer.willBeDeleted.connect(self.stop)
+
+    def _index_output_nodes(self) -> None:
+        """Read node features of the output layer and group them by source feature id."""
+        layer = self.output_layer.layer
+        request = QgsFeatureRequest().setSubsetOfAttributes(
+            [FIELD_FEATURE_ID, FIELD_PART, FIELD_RING, FIELD_VERTEX, FIELD_LOD],
+            layer.fields()
+        )
+        for feat in layer.getFeatures(request):
+            point = feat.geometry().constGet()
+            node = Node(feat[FIELD_PART], feat[FIELD_RING], feat[FIELD_VERTEX], point.x(), point.y(), feat[FIELD_LOD])
+            self.nodes.setdefault(feat[FIELD_FEATURE_ID], []).append((feat.id(), node))
+        for nodes in self.nodes.values():
+            nodes.sort(key=lambda node: (node[1].part, node[1].ring, node[1].vertex))
+
+    def stop(self) -> None:
+        """Stop following source layer edits."""
+        try:
+            self.src_layer.geometryChanged.disconnect(self.on_geometry_changed)
+            self.src_layer.featureDeleted.disconnect(self.on_feature_deleted)
+            self.src_layer.willBeDeleted.disconnect(self.stop)
+        except (RuntimeError, TypeError):
+            # Source layer already deleted
+            pass
+        self.nodes = {}
+
+    def on_feature_deleted(self, fid: int) -> None:
+        """Delete nodes of the deleted source feature."""
+        nodes = self.nodes.pop(fid, None)
+        if nodes:
+            self.output_layer.layer.dataProvider().deleteFeatures([node_id for node_id, _ in nodes])
+            self.output_layer.layer.triggerRepaint()
+
+    def on_geometry_changed(self, fid: int, geom: QgsGeometry) -> None:
+        """Update nodes of the source feature which geometry was changed."""
+        old_nodes = self.nodes.get(fid)
+        if old_nodes is None:
+            return
+
+        geom = to_wgs84(QgsGeometry(geom), self.transform)
+        # Levels are computed only when nodes are regenerated, moved nodes keep their levels
+        new_nodes = list(geometry_nodes(geom, with_levels=False))
+        if len(new_nodes) == len(old_nodes):
+            self._move_nodes(fid, old_nodes, new_nodes)
+        else:
+            if self.with_levels:
+                new_nodes = list(geometry_nodes(geom))
+            self._replace_nodes(fid, old_nodes, new_nodes)
+        self.output_layer.layer.triggerRepaint()
+
+    def _move_nodes(self, fid: int, old_nodes: list, new_nodes: list) -> None:
+        """Update geometry and coordinates of the nodes which location changed, levels of the nodes are kept."""
+        fields = self.output_layer.layer.fields()
+        dms_index = fields.indexOf(FIELD_NAME)
+        location_indices = [fields.indexOf(name) for name in (FIELD_PART, FIELD_RING, FIELD_VERTEX, FIELD_LOD)]
+        moved = []
+        attributes = {}
+        for i, ((node_id, old_node), new_node) in enumerate(zip(old_nodes, new_nodes)):
+            new_node = new_node._replace(level=old_node.level)
+            if (old_node.x, old_node.y) != (new_node.x, new_node.y):
+                moved.append(i)
+            elif old_node != new_node:
+                attributes[node_id] = self._location_attributes(location_indices, new_node)
+            old_nodes[i] = (node_id, new_node)
+
+        geometries = {}
+        xs = [new_nodes[i].x for i in moved]
+        ys = [new_nodes[i].y for i in moved]
+        for i, dms in zip(moved, self.format_func(xs, ys)):
+            node_id, node = old_nodes[i]
+            geometries[node_id] = QgsGeometry(QgsPoint(node.x, node.y))
+            attributes[node_id] = self._location_attributes(location_indices, node)
+            attributes[node_id][dms_index] = dms
+
+        prov = self.output_layer.layer.dataProvider()
+        if geometries:
+            prov.changeGeometryValues(geometries)
+        if attributes:
+            prov.changeAttributeValues(attributes)
+
+    @staticmethod
+    def _location_attributes(location_indices: list[int], node: Node) -> dict[int, int]:
+        """Return part, ring, vertex, level attributes of the node as field index -> value dictionary."""
+        return dict(zip(location_indices, (node.part, node.ring, node.vertex, node.level)))
+
+    def _replace_nodes(self, fid: int, old_nodes: list, new_nodes: list) -> None:
+        """Replace all nodes of the source feature, used when nodes were added or deleted."""
+        prov = self.output_layer.layer.dataProvider()
+        prov.deleteFeatures([node_id for node_id, _ in old_nodes])
+
+        fields = self.output_layer.layer.fields()
+        xs = [node.x for node in new_nodes]
+        ys = [node.y for node in new_nodes]
+        features = []
+        for node, dms in zip(new_nodes, self.format_func(xs, ys)):
+            feat = QgsFeature(fields)
+            feat.setGeometry(QgsGeometry(QgsPoint(node.x, node.y)))
+            feat.setAttributes(node_attributes(node, dms, fid, str(fid)))
+            features.append(feat)
+        _, added_features = prov.addFeatures(features)
+        self.nodes[fid] = [(feat.id(), node) for feat, node in zip(added_features, new_nodes)]
+        self.output_layer.layer.updateExtents()
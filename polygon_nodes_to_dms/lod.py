@@ -0,0 +1,92 @@
+"""Level of detail of polygon nodes.
+
+Each node of the ring gets importance level based on Douglas-Peucker simplification: level 0 - the most important
+nodes, kept in the most simplified ring, higher levels - nodes kept only in less simplified rings.
+Node with level L is kept if the ring is simplified with tolerance smaller than 2 ** -L coordinate units.
+"""
+from __future__ import annotations
+
+import math
+from array import array
+from typing import TYPE_CHECKING, Sequence
+
+if TYPE_CHECKING:
+    from .wkb import PolygonCoordinates
+
+MAX_LEVEL = 30
+
+
+def _distance_to_segment(x: float, y: float, x1: float, y1: float, x2: float, y2: float) -> float:
+    """Return distance of the point x, y to the segment x1, y1 - x2, y2."""
+    dx = x2 - x1
+    dy = y2 - y1
+    length_squared = dx * dx + dy * dy
+    if length_squared == 0:
+        return math.hypot(x - x1, y - y1)
+    t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length_squared))
+    return math.hypot(x - (x1 + t * dx), y - (y1 + t * dy))
+
+
+def significances(xs: Sequence[float], ys: Sequence[float]) -> list[float]:
+    """Return Douglas-Peucker significance of each node of the ring - the largest simplification tolerance
+    the node is kept with. First and last node and the node farthest from the first one have infinite significance.
+
+    :param xs: x coordinates of the ring nodes
+    :param ys: y coordinates of the ring nodes
+    :return: significance of each node in coordinate units
+    """
+    count = len(xs)
+    result = [math.inf] * count
+    if count < 3:
+        return result
+
+    # Closed ring is split by the node farthest from the first node, so that segments are not degenerated
+    farthest = max(range(count), key=lambda i: math.hypot(xs[i] - xs[0], ys[i] - ys[0]))
+    stack = [(0, farthest, math.inf), (farthest, count - 1, math.inf)]
+    while stack:
+        start, end, parent_significance = stack.pop()
+        if end - start < 2:
+            continue
+        max_distance = -1.0
+        max_index = start + 1
+        for i in range(start + 1, end):
+            distance = _distance_to_segment(xs[i], ys[i], xs[start], ys[start], xs[end], ys[end])
+            if distance > max_distance:
+                max_distance = distance
+                max_index = i
+        # Node can't be more significant than the node which split the segment before
+        significance = min(max_distance, parent_significance)
+        result[max_index] = significance
+        stack.append((start, max_index, significance))
+        stack.append((max_index, end, significance))
+    return result
+
+
+def importance_levels(xs: Sequence[float], ys: Sequence[float]) -> list[int]:
+    """Return importance level of each node of the ring, 0 - the most important nodes.
+
+    :param xs: x coordinates of the ring nodes
+    :param ys: y coordinates of the ring nodes
+    :return: levels from 0 to MAX_LEVEL
+    """
+    levels = []
+    for significance in significances(xs, ys):
+        if significance >= 1.0:
+            levels.append(0)
+        elif significance <= 2.0 ** -MAX_LEVEL:
+            levels.append(MAX_LEVEL)
+        else:
+            levels.append(min(MAX_LEVEL, math.ceil(-math.log2(significance))))
+    return levels
+
+
+def coordinate_levels(coords: PolygonCoordinates) -> array:
+    """Return importance levels of the nodes within their rings.
+
+    :param coords: node coordinates of the polygon/multipolygon
+    :return: level of each node
+    """
+    levels = array("i")
+    for start, end in coords.ring_slices:
+        levels.extend(importance_levels(coords.xs[start:end], coords.ys[start:end]))
+    return levels
@@ -0,0 +1,220 @@
+"""Persistent SQLite cache of the generated nodes of the source features.
+
+Nodes of the feature are stored in one row keyed by the source layer, feature id, coordinate order, precision
+and format,
+together with the hash of the feature WKB in WGS84. Cached nodes are used only if the hash matches - geometry
+of the feature did not change since nodes were generated. Cache keeps at most max_features rows, least recently
+used rows are removed when cache is closed.
+"""
+from __future__ import annotations
+
+import hashlib
+import sqlite3
+import time
+from array import array
+
+from .coordinate_format import FORMAT_DMS
+from .wkb import PolygonCoordinates
+
+# Cached rows are committed in batches of COMMIT_SIZE features
+COMMIT_SIZE = 1000
+# Default maximum number of cached features
+MAX_FEATURES = 100000
+# Version of the cache table, table is created again if version of the database is different
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS feature_nodes (
+    source TEXT NOT NULL,
+    feature_id INTEGER NOT NULL,
+    coord_order TEXT NOT NULL,
+    precision INTEGER NOT NULL,
+    coord_format TEXT NOT NULL,
+    wkb_hash BLOB NOT NULL,
+    xs BLOB NOT NULL,
+    ys BLOB NOT NULL,
+    parts BLOB NOT NULL,
+    rings BLOB NOT NULL,
+    vertices BLOB NOT NULL,
+    levels BLOB NOT NULL,
+    dms TEXT NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (source, feature_id, coord_order, precision, coord_format)
+) WITHOUT ROWID
+"""
+
+
+def wkb_hash(wkb: bytes) -> bytes:
+    """Return hash of the geometry WKB."""
+    return hashlib.blake2b(wkb, digest_size=16).digest()
+
+
+def _to_array(typecode: str, data: bytes) -> array:
+    """Return array of the given type from its bytes."""
+    values = array(typecode)
+    values.frombytes(data)
+    return values
+
+
+class NodeCache:
+    """SQLite cache of the nodes of the source features. Connection is bound to the thread which opened cache,
+    use cache as context manager in the thread generating nodes:
+
+        with NodeCache(path) as cache:
+            cached = cache.get(source, feature_id, wkb, coord_order, precision, coord_format)
+    """
+
+    def __init__(self, path: str, max_features: int = MAX_FEATURES):
+        """
+        :param path: path to SQLite database file, created if it does not exist
+        :param max_features: maximum number of cached features, least recently used features are removed
+            when cache is closed
+        """
+        self.path = path
+        self.max_features = max_features
+        self.connection = None
+        self.hits = 0
+        self.misses = 0
+        self._pending = 0
+
+    def __enter__(self) -> NodeCache:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Open database, create cache table if needed."""
+        # Cache can be shared by processes, e.g. command line converter workers
+        self.connection = sqlite3.connect(self.path, timeout=30)
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Cache created by the previous plugin version
+            self.connection.execute("DROP TABLE IF EXISTS feature_nodes")
+            self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.connection.execute(_SCHEMA)
+        self.connection.execute("CREATE INDEX IF NOT EXISTS feature_nodes_last_used ON feature_nodes (last_used)")
+        self.connection.commit()
+
+    def close(self) -> None:
+        """Remove least recently used rows above max_features, commit cached rows and close database."""
+        if self.connection is not None:
+            self.evict()
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+
+    def get(self,
+            source: str,
+            feature_id: int,
+            wkb: bytes,
+            coord_order: str,
+            precision: int,
+            coord_format: str = FORMAT_DMS,
+            with_levels: bool = True) -> tuple[PolygonCoordinates, array, list[str]] | None:
+        """Return cached nodes of the feature.
+
+        :param source: source layer, e.g. data source URI
+        :param feature_id: id of the source feature
+        :param wkb: WKB of the feature geometry in WGS84
+        :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+        :param precision: number of decimal places of the last format component
+        :param coord_format: coordinate format, one of coordinate_format.FORMATS
+        :param with_levels: True if importance levels are needed, nodes cached without levels are not used then;
+            False - nodes cached without levels get level 0
+        :return: node coordinates, importance levels, formatted coordinates; None if nodes are not cached
+            or geometry changed
+        """
+        row = self.connection.execute(
+            "SELECT wkb_hash, xs, ys, parts, rings, vertices, levels, dms FROM feature_nodes "
+            "WHERE source = ? AND feature_id = ? AND coord_order = ? AND precision = ? AND coord_format = ?",
+            (source, feature_id, coord_order, precision, coord_format)
+        ).fetchone()
+        # Empty levels - nodes cached without levels
+        if row is None or row[0] != wkb_hash(wkb) or (with_levels and not row[6] and row[1]):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.connection.execute(
+            "UPDATE feature_nodes SET last_used = ? "
+            "WHERE source = ? AND feature_id = ? AND coord_order = ? AND precision = ? AND coord_format = ?",
+            (time.time(), source, feature_id, coord_order, precision, coord_format)
+        )
+        self._count_pending()
+        coords = PolygonCoordinates(
+            _to_array("d", row[1]),
+            _to_array("d", row[2]),
+            _to_array("i", row[3]),
+            _to_array("i", row[4]),
+            _to_array("i", row[5]),
+            []
+        )
+        dms = row[7].split("\n") if row[7] else []
+        levels = _to_array("i", row[6]) if row[6] else array("i", [0]) * len(coords.xs)
+        return coords, levels, dms
+
+    def put(self,
+            source: str,
+            feature_id: int,
+            wkb: bytes,
+            coord_order: str,
+            precision: int,
+            coord_format: str,
+            coords: PolygonCoordinates,
+            levels: array,
+            dms: list[str]) -> None:
+        """Store nodes of the feature, previously cached nodes of the feature are replaced.
+        See get for parameters description, levels are empty if nodes were generated without levels.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO feature_nodes VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                source,
+                feature_id,
+                coord_order,
+                precision,
+                coord_format,
+                wkb_hash(wkb),
+                coords.xs.tobytes(),
+                coords.ys.tobytes(),
+                coords.parts.tobytes(),
+                coords.rings.tobytes(),
+                coords.vertices.tobytes(),
+                array("i", levels).tobytes(),
+                "\n".join(dms),
+                time.time()
+            )
+        )
+        self._count_pending()
+
+    def _count_pending(self) -> None:
+        """Count changed row, commit changes in batches of COMMIT_SIZE rows."""
+        self._pending += 1
+        if self._pending >= COMMIT_SIZE:
+            self.connection.commit()
+            self._pending = 0
+
+    def evict(self) -> int:
+        """Remove least recently used rows above max_features.
+
+        :return: number of removed rows
+        """
+        count = self.connection.execute("SELECT COUNT(*) FROM feature_nodes").fetchone()[0]
+        if count <= self.max_features:
+            return 0
+        self.connection.execute(
+            "DELETE FROM feature_nodes WHERE (source, feature_id, coord_order, precision, coord_format) IN ("
+            "SELECT source, feature_id, coord_order, precision, coord_format FROM feature_nodes "
+            "ORDER BY last_used LIMIT ?)",
+            (count - self.max_features,)
+        )
+        self.connection.commit()
+        self._pending = 0
+        return count - self.max_features
+
+    def clear(self) -> None:
+        """Remove all cached nodes."""
+        self.connection.execute("DELETE FROM feature_nodes")
+        self.connection.commit()
+        self.connection.execute("VACUUM")
@@ -0,0 +1,67 @@
+"""Index of unique nodes used to merge nodes shared by adjacent polygons."""
+from __future__ import annotations
+
+import math
+from typing import Hashable
+
+
+class NodeIndex:
+    """Hashed coordinate index of unique nodes. Nodes closer than tolerance to already indexed node are merged with it,
+    the list of owners of the merged nodes is kept for each unique node.
+    """
+
+    def __init__(self, tolerance: float = 0.0):
+        """
+        :param tolerance: maximum difference of x and y coordinates of the merged nodes, 0 - only identical nodes
+            are merged
+        """
+        self.tolerance = tolerance
+        self.xs = []
+        self.ys = []
+        self.owners = []
+        # Grid cell or exact coordinates -> indices of the nodes
+        self._cells = {}
+
+    def __len__(self) -> int:
+        return len(self.xs)
+
+    def _cell(self, x: float, y: float) -> tuple:
+        """Return key of the grid cell containing coordinates."""
+        return math.floor(x / self.tolerance), math.floor(y / self.tolerance)
+
+    def find(self, x: float, y: float) -> int | None:
+        """Return index of the node matching coordinates, None if there is no such node."""
+        if not self.tolerance:
+            node_indices = self._cells.get((x, y))
+            return node_indices[0] if node_indices else None
+
+        cell_x, cell_y = self._cell(x, y)
+        # Node within tolerance can be in the same or in one of the neighbouring cells
+        for neighbour in ((cell_x + dx, cell_y + dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1)):
+            for node_index in self._cells.get(neighbour, ()):
+                if abs(self.xs[node_index] - x) <= self.tolerance and abs(self.ys[node_index] - y) <= self.tolerance:
+                    return node_index
+        return None
+
+    def add(self, x: float, y: float, owner: Hashable) -> int:
+        """Add node to the index, merge it with existing node if it matches coordinates.
+
+        :param x: x coordinate of the node
+        :param y: y coordinate of the node
+        :param owner: owner of the node, e.g. feature id, added once to the list of owners of the node
+        :return: index of the unique node, equal to the number of nodes before adding if node is a new one
+        """
+        node_index = self.find(x, y)
+        if node_index is not None:
+            owners = self.owners[node_index]
+            if owner not in owners:
+                owners.append(owner)
+            return node_index
+
+        node_index = len(self.xs)
+        key = self._cell(x, y) if self.tolerance else (x, y)
+        self._cells.setdefault(key, []).append(node_index)
+        self.xs.append(x)
+        self.ys.append(y)
+        self.owners.append([owner])
+        return node_index
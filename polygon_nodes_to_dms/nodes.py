@@ -0,0 +1,385 @@
+"""Generating node features with coordinates in DMS format from polygon features."""
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Callable, Iterable, Iterator, NamedTuple, Sequence
+
+from qgis.core import (
+    QgsCoordinateTransform,
+    QgsCurve,
+    QgsFeature,
+    QgsFields,
+    QgsGeometry,
+    QgsLineString,
+    QgsMultiPolygon,
+    QgsPoint,
+    QgsPolygon
+)
+
+from .coordinate_format import FORMAT_DMS, DMSCache, compile_format
+from .crs_transform import to_wgs84
+from .lod import MAX_LEVEL
+from .node_cache import NodeCache
+from .node_index import NodeIndex
+from .wkb import PolygonCoordinates, decode_polygon_wkb
+
+
+class Node(NamedTuple):
+    """Polygon node with its location in the geometry."""
+    part: int
+    ring: int
+    vertex: int
+    x: float
+    y: float
+    # Importance level within the ring, see lod module
+    level: int
+
+
+def geometry_rings(geom: QgsGeometry) -> Iterator[tuple[int, int, QgsCurve]]:
+    """Yield rings of the polygon/multipolygon geometry, exterior ring first.
+
+    :param geom: polygon/multipolygon geometry
+    :return: part index, ring index, ring
+    """
+    for part_index, part in enumerate(geom.constParts()):
+        yield part_index, 0, part.exteriorRing()
+        for interior_ring_index in range(part.numInteriorRings()):
+            yield part_index, interior_ring_index + 1, part.interiorRing(interior_ring_index)
+
+
+def _ring_coordinates(geom: QgsGeometry) -> PolygonCoordinates:
+    """Return coordinates of the geometry nodes read ring by ring, used for curved geometries."""
+    result = PolygonCoordinates(array("d"), array("d"), array("i"), array("i"), array("i"), [])
+    for part_index, ring_index, ring in geometry_rings(geom):
+        points = ring.points()
+        start = len(result.xs)
+        result.xs.extend(point.x() for point in points)
+        result.ys.extend(point.y() for point in points)
+        result.parts.extend([part_index] * len(points))
+        result.rings.extend([ring_index] * len(points))
+        result.vertices.extend(range(len(points)))
+        result.ring_slices.append((start, start + len(points)))
+    return result
+
+
+def linear_geometry(geom: QgsGeometry) -> QgsGeometry:
+    """Return multipolygon with straight segments between the nodes of the curved polygon/multisurface rings.
+    Multipolygon has the same nodes, parts and rings as the curved geometry, see geometry_coordinates.
+
+    :param geom: curved polygon/multisurface geometry
+    :return: multipolygon geometry
+    """
+    parts = {}
+    for part_index, _, ring in geometry_rings(geom):
+        parts.setdefault(part_index, []).append(QgsLineString(ring.points()))
+    multipolygon = QgsMultiPolygon()
+    for rings in parts.values():
+        polygon = QgsPolygon()
+        polygon.setExteriorRing(rings[0])
+        for ring in rings[1:]:
+            polygon.addInteriorRing(ring)
+        multipolygon.addGeometry(polygon)
+    return QgsGeometry(multipolygon)
+
+
+def geometry_coordinates(geom: QgsGeometry) -> PolygonCoordinates:
+    """Return coordinates of all nodes of the polygon/multipolygon geometry with their location in the geometry.
+    Coordinates are decoded directly from WKB, no point object is created for the nodes.
+
+    :param geom: polygon/multipolygon geometry
+    :return: node coordinates
+    """
+    try:
+        return decode_polygon_wkb(geom.asWkb())
+    except ValueError:
+        # Curve polygons, multisurfaces
+        return _ring_coordinates(geom)
+
+
+# Douglas-Peucker simplification, QGIS >= 3.38; older versions simplify preserving topology
+_SIMPLIFY_BY_DISTANCE = hasattr(QgsLineString, "simplifyByDistance")
+# Tolerance of the level is slightly smaller than 2 ** -level, node with distance exactly 2 ** -level is kept
+_TOLERANCE_FACTOR = 1.0 - 1e-9
+
+
+def _simplified_z(line: QgsLineString, tolerance: float) -> list[float]:
+    """Return z coordinates of the nodes kept in the simplified line."""
+    if _SIMPLIFY_BY_DISTANCE:
+        return line.simplifyByDistance(tolerance).zVector()
+    simplified = QgsGeometry(line.clone()).simplify(tolerance)
+    return simplified.constGet().zVector()
+
+
+def simplification_levels(xs: Sequence[float], ys: Sequence[float]) -> list[int]:
+    """Return importance level of each node of the ring, the same as lod.importance_levels.
+    Ring is split by the node farthest from the first node and each half is simplified in QGIS (GEOS)
+    with tolerances of the consecutive levels, level of the node is the first level it is kept at.
+    Node indices are passed through simplification as z coordinates, no Python loop over segments is needed.
+    Before QGIS 3.38 rings are simplified preserving topology, levels are approximate then.
+
+    :param xs: x coordinates of the ring nodes
+    :param ys: y coordinates of the ring nodes
+    :return: levels from 0 to MAX_LEVEL
+    """
+    count = len(xs)
+    levels = [0] * count
+    if count < 3:
+        return levels
+    x0 = xs[0]
+    y0 = ys[0]
+    farthest = max(range(count), key=lambda i: math.hypot(xs[i] - x0, ys[i] - y0))
+    for start, end in ((0, farthest), (farthest, count - 1)):
+        if end - start < 2:
+            continue
+        levels[start + 1:end] = [-1] * (end - start - 1)
+        line = QgsLineString(
+            list(xs[start:end + 1]), list(ys[start:end + 1]), [float(i) for i in range(start, end + 1)]
+        )
+        kept_count = 2
+        for level in range(MAX_LEVEL + 1):
+            indices = _simplified_z(line, math.ldexp(_TOLERANCE_FACTOR, -level))
+            # Simplified lines are nested, the same number of nodes - the same nodes
+            if len(indices) == kept_count:
+                continue
+            kept_count = len(indices)
+            for index in indices:
+                index = int(index)
+                if levels[index] < 0:
+                    levels[index] = level
+            if kept_count == end - start + 1:
+                break
+        levels[start + 1:end] = [MAX_LEVEL if level < 0 else level for level in levels[start + 1:end]]
+    return levels
+
+
+def node_levels(coords: PolygonCoordinates, with_levels: bool = True) -> array:
+    """Return importance levels of the nodes within their rings, see lod module.
+
+    :param coords: node coordinates of the polygon/multipolygon
+    :param with_levels: False if levels are not needed, all nodes get level 0
+    :return: level of each node
+    """
+    if not with_levels:
+        return array("i", [0]) * len(coords.xs)
+    levels = array("i")
+    for start, end in coords.ring_slices:
+        levels.extend(simplification_levels(coords.xs[start:end], coords.ys[start:end]))
+    return levels
+
+
+def geometry_nodes(geom: QgsGeometry, with_levels: bool = True) -> Iterator[Node]:
+    """Yield nodes of the polygon/multipolygon geometry.
+
+    :param geom: polygon/multipolygon geometry
+    :param with_levels: False if importance levels are not needed, all nodes get level 0
+    :return: nodes
+    """
+    coords = geometry_coordinates(geom)
+    return map(
+        Node, coords.parts, coords.rings, coords.vertices, coords.xs, coords.ys, node_levels(coords, with_levels)
+    )
+
+
+def node_attributes(node: Node, dms: str, feature_id: int, feature_ids: str) -> list:
+    """Return attributes of the node feature in the order of node_fields."""
+    return [dms, feature_id, node.part, feature_ids, node.level, node.ring, node.vertex]
+
+
+def coordinate_node_features(feature_id: int,
+                             coords: PolygonCoordinates,
+                             levels: Sequence[int],
+                             formatted: Sequence[str],
+                             fields: QgsFields,
+                             indices: Sequence[int] | None = None) -> Iterator[QgsFeature]:
+    """Yield node features of one source feature from its node coordinates.
+
+    :param feature_id: id of the source feature
+    :param coords: node coordinates of the source feature
+    :param levels: importance levels of all nodes
+    :param formatted: formatted coordinates of the nodes given by indices
+    :param fields: fields of the output node features
+    :param indices: indices of the nodes in coords, all nodes if not given
+    :return: node features
+    """
+    if indices is None:
+        indices = range(len(coords.xs))
+    feature_ids = str(feature_id)
+    for i, dms in zip(indices, formatted):
+        node = Node(coords.parts[i], coords.rings[i], coords.vertices[i], coords.xs[i], coords.ys[i], levels[i])
+        feat = QgsFeature(fields)
+        feat.setGeometry(QgsGeometry(QgsPoint(node.x, node.y)))
+        feat.setAttributes(node_attributes(node, dms, feature_id, feature_ids))
+        yield feat
+
+
+def coordinates_formatter(coord_order: str,
+                          precision: int = 3,
+                          coord_format: str = FORMAT_DMS,
+                          cache: DMSCache | None = None) -> Callable[[Sequence[float], Sequence[float]], list[str]]:
+    """Return function formatting longitudes, latitudes arrays, compiled once for the whole run.
+
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :param cache: cache of formatted coordinates, coordinates are always formatted if not given
+    """
+    if cache is not None:
+        return lambda xs, ys: cache.format_dms(xs, ys, coord_order, precision, coord_format)
+    return compile_format(coord_format, coord_order, precision)
+
+
+def node_features(features: Iterable[QgsFeature],
+                  fields: QgsFields,
+                  coord_order: str,
+                  precision: int = 3,
+                  cache: DMSCache | None = None,
+                  transform: QgsCoordinateTransform | None = None,
+                  node_cache: NodeCache | None = None,
+                  source: str = "",
+                  coord_format: str = FORMAT_DMS,
+                  with_levels: bool = True) -> Iterator[QgsFeature]:
+    """Yield point feature with DMS coordinates for each node of each feature.
+    Features are processed one at a time, so features iterator is not materialised.
+
+    :param features: polygon/multipolygon features
+    :param fields: fields of the output node features
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param cache: cache of formatted coordinates, coordinates are always formatted if not given
+    :param transform: transformation of the features geometry to WGS84, None if features are in WGS84
+    :param node_cache: open cache of the nodes of the source features
+    :param source: source layer of the features, key of the node_cache
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :param with_levels: False if importance levels are not needed, all nodes get level 0
+    :return: node features in WGS84
+    """
+    format_func = coordinates_formatter(coord_order, precision, coord_format, cache)
+    for feature in features:
+        geom = to_wgs84(feature.geometry(), transform)
+        if node_cache is not None:
+            yield from _cached_node_features(
+                feature.id(), geom, fields, coord_order, precision, coord_format, format_func, node_cache, source,
+                with_levels
+            )
+            continue
+        coords = geometry_coordinates(geom)
+        yield from coordinate_node_features(
+            feature.id(), coords, node_levels(coords, with_levels), format_func(coords.xs, coords.ys), fields
+        )
+
+
+def _cached_node_features(feature_id: int,
+                          geom: QgsGeometry,
+                          fields: QgsFields,
+                          coord_order: str,
+                          precision: int,
+                          coord_format: str,
+                          format_func: Callable[..., list[str]],
+                          node_cache: NodeCache,
+                          source: str,
+                          with_levels: bool) -> Iterator[QgsFeature]:
+    """Yield node features of the feature from the node cache, generate and cache them if geometry changed.
+    Nodes generated without levels are cached without levels.
+    """
+    wkb = bytes(geom.asWkb())
+    cached = node_cache.get(source, feature_id, wkb, coord_order, precision, coord_format, with_levels)
+    if cached is None:
+        coords = geometry_coordinates(geom)
+        levels = node_levels(coords, with_levels)
+        formatted = format_func(coords.xs, coords.ys)
+        node_cache.put(
+            source, feature_id, wkb, coord_order, precision, coord_format, coords,
+            levels if with_levels else array("i"), formatted
+        )
+    else:
+        coords, levels, formatted = cached
+    yield from coordinate_node_features(feature_id, coords, levels, formatted, fields)
+
+
+def unique_node_features(features: Iterable[QgsFeature],
+                         fields: QgsFields,
+                         coord_order: str,
+                         precision: int = 3,
+                         tolerance: float = 0.0,
+                         cache: DMSCache | None = None,
+                         transform: QgsCoordinateTransform | None = None,
+                         coord_format: str = FORMAT_DMS,
+                         with_levels: bool = True) -> Iterator[QgsFeature]:
+    """Yield point feature with DMS coordinates for each unique node of all features.
+    Nodes shared by adjacent features and ring closing nodes are formatted and yielded once,
+    ids of all features sharing node are listed in the feature_ids attribute,
+    importance level of the shared node is the highest importance among the merged nodes.
+
+    :param features: polygon/multipolygon features
+    :param fields: fields of the output node features
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param tolerance: nodes with x and y coordinates (WGS84) differing not more than tolerance are merged
+    :param cache: cache of formatted coordinates, coordinates are always formatted if not given
+    :param transform: transformation of the features geometry to WGS84, None if features are in WGS84
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :param with_levels: False if importance levels are not needed, all nodes get level 0
+    :return: node features in WGS84
+    """
+    format_func = coordinates_formatter(coord_order, precision, coord_format, cache)
+    index = NodeIndex(tolerance)
+    levels = []
+    for feature in features:
+        feature_id = feature.id()
+        for node in geometry_nodes(to_wgs84(feature.geometry(), transform), with_levels):
+            node_index = index.add(node.x, node.y, (feature_id, node))
+            if node_index == len(levels):
+                levels.append(node.level)
+            else:
+                levels[node_index] = min(levels[node_index], node.level)
+
+    formatted = format_func(index.xs, index.ys)
+    for x, y, owners, level, dms in zip(index.xs, index.ys, index.owners, levels, formatted):
+        feature_ids = list(dict.fromkeys(feature_id for feature_id, _ in owners))
+        # Location in the geometry of the first owner
+        feature_id, node = owners[0]
+        feat = QgsFeature(fields)
+        feat.setGeometry(QgsGeometry(QgsPoint(x, y)))
+        feat.setAttributes(
+            node_attributes(node._replace(x=x, y=y, level=level), dms, feature_id, ",".join(map(str, feature_ids)))
+        )
+        yield feat
+
+
+def generate_node_features(features: Iterable[QgsFeature],
+                           fields: QgsFields,
+                           coord_order: str,
+                           precision: int = 3,
+                           merge_shared: bool = False,
+                           tolerance: float = 0.0,
+                           cache: DMSCache | None = None,
+                           transform: QgsCoordinateTransform | None = None,
+                           workers: int = 1,
+                           node_cache: NodeCache | None = None,
+                           source: str = "",
+                           coord_format: str = FORMAT_DMS,
+                           with_levels: bool = True) -> Iterator[QgsFeature]:
+    """Yield node features of all features, merge shared nodes if required.
+    See node_features and unique_node_features for parameters description.
+
+    :param workers: number of processes formatting coordinates if shared nodes are not merged, 1 - no processes,
+        see parallel_nodes module; cache is not used by the processes
+    :param node_cache: open cache of the nodes of the source features, used only if shared nodes are not merged
+        and coordinates are formatted in this process
+    :param source: source layer of the features, key of the node_cache
+    """
+    if merge_shared:
+        return unique_node_features(
+            features, fields, coord_order, precision, tolerance, cache, transform, coord_format, with_levels
+        )
+    if workers > 1:
+        # parallel_nodes imports this module
+        from .parallel_nodes import parallel_node_features  # pylint: disable=import-outside-toplevel
+        return parallel_node_features(
+            features, fields, coord_order, precision, transform, workers, coord_format, with_levels
+        )
+    return node_features(
+        features, fields, coord_order, precision, cache, transform=transform, node_cache=node_cache, source=source,
+        coord_format=coord_format, with_levels=with_levels
+    )
@@ -0,0 +1,215 @@
+"""Processing algorithm generating polygon nodes with coordinates in DMS format."""
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+from qgis.core import (
+    QgsCoordinateReferenceSystem,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFeatureSink,
+    QgsProcessing,
+    QgsProcessingAlgorithm,
+    QgsProcessingContext,
+    QgsProcessingException,
+    QgsProcessingFeedback,
+    QgsProcessingParameterBoolean,
+    QgsProcessingParameterDefinition,
+    QgsProcessingParameterEnum,
+    QgsProcessingParameterFeatureSink,
+    QgsProcessingParameterFeatureSource,
+    QgsProcessingParameterNumber,
+    QgsWkbTypes
+)
+from qgis.PyQt.QtCore import QCoreApplication
+
+from .coordinate_format import FORMATS, ORDER_XY, ORDER_YX
+from .crs_transform import wgs84_transform
+
+# Coordinate orders in the same order as ORDER parameter options
+COORDINATE_ORDERS = [ORDER_XY, ORDER_YX]
+
+
+def progress_features(features: Iterable[QgsFeature],
+                      features_count: int,
+                      feedback: QgsProcessingFeedback) -> Iterator[QgsFeature]:
+    """Yield features and report progress of reading them, stop when algorithm is canceled.
+
+    :param features: source features
+    :param features_count: number of the source features
+    :param feedback: feedback of the algorithm
+    :return: source features
+    """
+    step = 100.0 / features_count if features_count else 0
+    for feature_nr, feature in enumerate(features):
+        if feedback.isCanceled():
+            return
+        yield feature
+        feedback.setProgress(int((feature_nr + 1) * step))
+
+
+class PolygonNodesToDMSAlgorithm(QgsProcessingAlgorithm):
+    """Generate point layer with polygon nodes and their coordinates in DMS format."""
+
+    INPUT = "INPUT"
+    ORDER = "ORDER"
+    FORMAT = "FORMAT"
+    PRECISION = "PRECISION"
+    MERGE_SHARED = "MERGE_SHARED"
+    TOLERANCE = "TOLERANCE"
+    WORKERS = "WORKERS"
+    OUTPUT = "OUTPUT"
+
+    @staticmethod
+    def tr(message: str) -> str:
+        """Get the translation for a string using Qt translation API."""
+        return QCoreApplication.translate("PolygonNodesToDMSAlgorithm", message)
+
+    def createInstance(self) -> PolygonNodesToDMSAlgorithm:
+        return PolygonNodesToDMSAlgorithm()
+
+    def name(self) -> str:
+        return "polygonnodestodms"
+
+    def displayName(self) -> str:
+        return self.tr("Polygon nodes to DMS")
+
+    def shortHelpString(self) -> str:
+        return self.tr(
+            "Generates point layer with nodes of the polygons/multipolygons "
+            "and their coordinates in DMS, DDM, decimal degrees or compact DDMMSS.ssN DDDMMSS.ssE format "
+            "as node_dms attribute."
+        )
+
+    def initAlgorithm(self, config: dict[str, Any] | None = None) -> None:
+        # Feature source parameter has "Selected features only" option
+        self.addParameter(
+            QgsProcessingParameterFeatureSource(
+                self.INPUT,
+                self.tr("Input polygon layer"),
+                [QgsProcessing.TypeVectorPolygon]
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.ORDER,
+                self.tr("Coordinate order"),
+                options=[self.tr("Longitude, latitude"), self.tr("Latitude, longitude")],
+                defaultValue=0
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterEnum(
+                self.FORMAT,
+                self.tr("Coordinate format"),
+                # In the same order as coordinate_format.FORMATS
+                options=[
+                    self.tr("Degrees, minutes, seconds"),
+                    self.tr("Degrees, decimal minutes"),
+                    self.tr("Decimal degrees"),
+                    self.tr("Compact DDMMSS.ssN DDDMMSS.ssE")
+                ],
+                defaultValue=0
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.PRECISION,
+                self.tr("Precision (decimal places of seconds, minutes or degrees)"),
+                type=QgsProcessingParameterNumber.Integer,
+                defaultValue=3,
+                minValue=0,
+                maxValue=10
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterBoolean(
+                self.MERGE_SHARED,
+                self.tr("Merge nodes shared by features"),
+                defaultValue=False
+            )
+        )
+        self.addParameter(
+            QgsProcessingParameterNumber(
+                self.TOLERANCE,
+                self.tr("Merge tolerance"),
+                type=QgsProcessingParameterNumber.Double,
+                defaultValue=0.0,
+                minValue=0.0
+            )
+        )
+        workers = QgsProcessingParameterNumber(
+            self.WORKERS,
+            self.tr("Number of processes formatting coordinates (without merging shared nodes)"),
+            type=QgsProcessingParameterNumber.Integer,
+            defaultValue=1,
+            minValue=1
+        )
+        workers.setFlags(workers.flags() | QgsProcessingParameterDefinition.FlagAdvanced)
+        self.addParameter(workers)
+        self.addParameter(
+            QgsProcessingParameterFeatureSink(
+                self.OUTPUT,
+                self.tr("Nodes DMS"),
+                QgsProcessing.TypeVectorPoint
+            )
+        )
+
+    def processAlgorithm(self,
+                         parameters: dict[str, Any],
+                         context: QgsProcessingContext,
+                         feedback: QgsProcessingFeedback) -> dict[str, Any]:
+        # Nodes generating modules are not imported when the provider is registered on plugin load
+        # pylint: disable=import-outside-toplevel
+        from .nodes import generate_node_features, node_features
+        from .output_layer import node_fields
+
+        source = self.parameterAsSource(parameters, self.INPUT, context)
+        if source is None:
+            raise QgsProcessingException(self.invalidSourceError(parameters, self.INPUT))
+        coord_order = COORDINATE_ORDERS[self.parameterAsEnum(parameters, self.ORDER, context)]
+        coord_format = FORMATS[self.parameterAsEnum(parameters, self.FORMAT, context)]
+        precision = self.parameterAsInt(parameters, self.PRECISION, context)
+        merge_shared = self.parameterAsBoolean(parameters, self.MERGE_SHARED, context)
+        tolerance = self.parameterAsDouble(parameters, self.TOLERANCE, context)
+        workers = self.parameterAsInt(parameters, self.WORKERS, context)
+
+        fields = node_fields()
+        sink, dest_id = self.parameterAsSink(
+            parameters,
+            self.OUTPUT,
+            context,
+            fields,
+            QgsWkbTypes.Point,
+            QgsCoordinateReferenceSystem("EPSG:4326")
+        )
+        if sink is None:
+            raise QgsProcessingException(self.invalidSinkError(parameters, self.OUTPUT))
+
+        # Progress is reported as source features are read
+        features = progress_features(
+            source.getFeatures(QgsFeatureRequest().setNoAttributes()), source.featureCount(), feedback
+        )
+        transform = wgs84_transform(source.sourceCrs(), context.transformContext())
+
+        if merge_shared or workers > 1:
+            # Unique nodes are known after all features are read, worker processes get features in chunks
+            nodes = generate_node_features(
+                features, fields, coord_order, precision, merge_shared, tolerance,
+                transform=transform, workers=workers, coord_format=coord_format
+            )
+            for node in nodes:
+                if feedback.isCanceled():
+                    break
+                sink.addFeature(node, QgsFeatureSink.FastInsert)
+            return {self.OUTPUT: dest_id}
+
+        for feature in features:
+            # Nodes are generated and written to the sink feature by feature
+            nodes = node_features(
+                [feature], fields, coord_order, precision, transform=transform, coord_format=coord_format
+            )
+            for node in nodes:
+                sink.addFeature(node, QgsFeatureSink.FastInsert)
+
+        return {self.OUTPUT: dest_id}
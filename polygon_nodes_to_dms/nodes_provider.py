@@ -0,0 +1,21 @@
+"""Processing provider of the plugin."""
+from qgis.core import QgsProcessingProvider
+from qgis.PyQt.QtGui import QIcon
+
+from .nodes_algorithm import PolygonNodesToDMSAlgorithm
+
+
+class PolygonNodesToDMSProvider(QgsProcessingProvider):
+    """Provider of the plugin processing algorithms."""
+
+    def loadAlgorithms(self) -> None:
+        self.addAlgorithm(PolygonNodesToDMSAlgorithm())
+
+    def id(self) -> str:
+        return "polygonnodestodms"
+
+    def name(self) -> str:
+        return "PolygonNodesToDMS"
+
+    def icon(self) -> QIcon:
+        return QIcon(":/plugins/polygon_nodes_to_dms/icon.png")
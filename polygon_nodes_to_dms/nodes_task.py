@@ -0,0 +1,154 @@
+"""Background task generating polygon nodes with coordinates in DMS format."""
+from __future__ import annotations
+
+from contextlib import nullcontext
+from typing import Callable, Iterable, Iterator
+
+from qgis.core import (
+    Qgis,
+    QgsCoordinateTransform,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsFields,
+    QgsMessageLog,
+    QgsTask,
+    QgsVectorLayerFeatureSource
+)
+
+from .coordinate_format import FORMAT_DMS, DMSCache
+from .node_cache import MAX_FEATURES, NodeCache
+from .nodes import generate_node_features
+from .stage_timer import LOG_TAG, RunProfiler, StageTimer
+
+# Cancellation is checked every PROGRESS_STEP nodes, progress is reported per source feature
+PROGRESS_STEP = 1000
+
+
+class NodesTask(QgsTask):
+    """Generate node features for given features of the source layer in the background thread.
+    Output layer is not touched by the task - task is passed to on_finished callback together with the result,
+    callback is called in the main thread.
+    """
+
+    def __init__(self,
+                 source: QgsVectorLayerFeatureSource,
+                 feature_ids: Iterable[int],
+                 fields: QgsFields,
+                 coord_order: str,
+                 on_finished: Callable[[NodesTask, bool], None],
+                 merge_shared: bool = False,
+                 tolerance: float = 0.0,
+                 cache: DMSCache | None = None,
+                 transform: QgsCoordinateTransform | None = None,
+                 workers: int = 1,
+                 node_cache_path: str | None = None,
+                 node_cache_max_features: int = MAX_FEATURES,
+                 layer_source: str = "",
+                 precision: int = 3,
+                 coord_format: str = FORMAT_DMS,
+                 layer_id: str = "",
+                 with_levels: bool = True):
+        """
+        :param source: feature source of the source layer, must be created in the main thread
+        :param feature_ids: ids of the features for which nodes are generated
+        :param fields: fields of the output node features
+        :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+        :param on_finished: called with the task and the result when task is finished, canceled or failed
+        :param merge_shared: True if nodes shared by features are merged
+        :param tolerance: nodes with x and y coordinates differing not more than tolerance are merged
+        :param cache: cache of formatted coordinates shared between tasks
+        :param transform: transformation of the source layer geometries to WGS84, used only by this task
+        :param workers: number of processes formatting coordinates when shared nodes are not merged, 1 - no processes
+        :param node_cache_path: path to the SQLite cache of the generated nodes, nodes are not cached if not given
+        :param node_cache_max_features: maximum number of features in the nodes cache
+        :param layer_source: data source of the source layer, key of the cached nodes
+        :param precision: number of decimal places of the last format component
+        :param coord_format: coordinate format, one of coordinate_format.FORMATS
+        :param layer_id: id of the source layer, nodes are added to the output layer of the source layer
+        :param with_levels: False if importance levels of the nodes are not needed, all nodes get level 0
+        """
+        super().__init__("Generating polygon nodes in DMS format", QgsTask.CanCancel)
+        self.source = source
+        self.feature_ids = list(feature_ids)
+        self.fields = fields
+        self.coord_order = coord_order
+        self.on_finished = on_finished
+        self.merge_shared = merge_shared
+        self.tolerance = tolerance
+        self.cache = cache
+        self.transform = transform
+        self.workers = workers
+        self.node_cache_path = node_cache_path
+        self.node_cache_max_features = node_cache_max_features
+        self.layer_source = layer_source
+        self.precision = precision
+        self.coord_format = coord_format
+        self.layer_id = layer_id
+        self.with_levels = with_levels
+        self.node_cache_hits = 0
+        self.nodes = []
+        self.processed_features_count = 0
+        self.elapsed = 0.0
+        self.exception = None
+
+    def _source_features(self) -> Iterator[QgsFeature]:
+        """Yield source features, count processed features and report progress, stop when task is canceled.
+        Merging shared nodes and worker processes read all features before the first node is generated.
+        """
+        request = QgsFeatureRequest().setFilterFids(self.feature_ids).setNoAttributes()
+        for feature in self.source.getFeatures(request):
+            if self.isCanceled():
+                return
+            yield feature
+            self.processed_features_count += 1
+            self.setProgress(100 * self.processed_features_count / len(self.feature_ids))
+
+    def run(self) -> bool:
+        """Generate node features, executed in the background thread."""
+        self.elapsed = 0.0
+        try:
+            # SQLite connection is opened in the thread using it
+            node_cache_context = NodeCache(self.node_cache_path, self.node_cache_max_features) \
+                if self.node_cache_path else nullcontext()
+            with RunProfiler("generate_nodes"), StageTimer("Generating nodes") as timer, \
+                    node_cache_context as node_cache:
+                nodes = generate_node_features(
+                    self._source_features(),
+                    self.fields,
+                    self.coord_order,
+                    self.precision,
+                    merge_shared=self.merge_shared,
+                    tolerance=self.tolerance,
+                    cache=self.cache,
+                    transform=self.transform,
+                    workers=self.workers,
+                    node_cache=node_cache,
+                    source=self.layer_source,
+                    coord_format=self.coord_format,
+                    with_levels=self.with_levels
+                )
+                for node_nr, node in enumerate(nodes):
+                    if node_nr % PROGRESS_STEP == 0 and self.isCanceled():
+                        return False
+                    self.nodes.append(node)
+                # Reading features stopped, nodes generated so far are incomplete
+                if self.isCanceled():
+                    return False
+                timer.vertices = len(self.nodes)
+                if node_cache is not None:
+                    self.node_cache_hits = node_cache.hits
+        except Exception as e:  # pylint: disable=broad-except
+            self.exception = e
+            return False
+        self.elapsed = self.elapsedTime() / 1000
+        return True
+
+    def finished(self, result: bool) -> None:
+        """Pass task with generated nodes to the callback, executed in the main thread."""
+        if self.exception:
+            QgsMessageLog.logMessage(
+                f"Generating nodes failed: {self.exception}",
+                LOG_TAG,
+                level=Qgis.Critical
+            )
+        self.on_finished(self, result)
@@ -1,17 +1,94 @@
 """Handling output layer."""
+from __future__ import annotations
+
 from datetime import datetime
+from functools import partial
+from itertools import islice
+from typing import Iterable
 
 from qgis.core import (
+    QgsFeature,
+    QgsFeatureSource,
     QgsField,
+    QgsFields,
     QgsPalLayerSettings,
     QgsProject,
+    QgsProperty,
+    QgsSymbolLayer,
+    QgsVectorDataProvider,
     QgsVectorLayer,
     QgsVectorLayerSimpleLabeling
 )
 from qgis.gui import QgisInterface
 from qgis.PyQt.QtCore import QVariant
 
+from .label_settings import LabelSettings
+from .stage_timer import StageTimer
+
 FIELD_NAME = "node_dms"
+FIELD_FEATURE_ID = "feature_id"
+FIELD_PART = "part"
+FIELD_FEATURE_IDS = "feature_ids"
+FIELD_LOD = "lod"
+FIELD_RING = "ring"
+FIELD_VERTEX = "vertex"
+# Fields with attribute index, if supported by the data provider
+INDEXED_FIELDS = (FIELD_FEATURE_ID, FIELD_PART, FIELD_RING, FIELD_VERTEX)
+# Node is shown if its significance is not smaller than LOD_PIXELS pixels at the current map scale,
+# pixel size in degrees: scale * 0.28 mm / meters per degree
+LOD_PIXELS = 20
+LOD_FILTER_EXPRESSION = f'"{FIELD_LOD}" <= -log(2, @map_scale * 0.00028 / 111320 * {LOD_PIXELS})'
+# Number of node features handed to the data provider in one addFeatures call
+BATCH_SIZE = 10000
+
+
+def node_fields() -> QgsFields:
+    """Return fields of the output layer node features."""
+    fields = QgsFields()
+    fields.append(
+        QgsField(
+            name=FIELD_NAME,
+            type=QVariant.String,
+            len=100
+        )
+    )
+    fields.append(
+        QgsField(
+            name=FIELD_FEATURE_ID,
+            type=QVariant.LongLong
+        )
+    )
+    fields.append(
+        QgsField(
+            name=FIELD_PART,
+            type=QVariant.Int
+        )
+    )
+    fields.append(
+        QgsField(
+            name=FIELD_FEATURE_IDS,
+            type=QVariant.String
+        )
+    )
+    fields.append(
+        QgsField(
+            name=FIELD_LOD,
+            type=QVariant.Int
+        )
+    )
+    fields.append(
+        QgsField(
+            name=FIELD_RING,
+            type=QVariant.Int
+        )
+    )
+    fields.append(
+        QgsField(
+            name=FIELD_VERTEX,
+            type=QVariant.Int
+        )
+    )
+    return fields
 
 
 class OutputLayer:
@@ -21,11 +98,20 @@ class OutputLayer:
         self.iface = iface
         self.name = None
         self.layer = None
+        self.label_settings = LabelSettings()
 
     def _generate_name(self) -> None:
-        """Generate name based in format: NodesDMS_<YYYY>_<MM>_<DD>_<HH><MM>."""
+        """Generate name based in format: NodesDMS_<YYYY>_<MM>_<DD>_<HH><MM>,
+        _<n> suffix is added if layer with the name is already in the project.
+        """
         timestamp = datetime.now()
-        self.name = f'NodesDMS_{timestamp.strftime("%Y_%m_%d_%H%M")}'
+        base_name = f'NodesDMS_{timestamp.strftime("%Y_%m_%d_%H%M")}'
+        self.name = base_name
+        number = 1
+        # Names are checked only when layer is created
+        while QgsProject.instance().mapLayersByName(self.name):
+            number += 1
+            self.name = f"{base_name}_{number}"
 
     def create(self) -> None:
         """Create result layer as Point layer. Note this is memory layer so before closing QGIS save it on the disk
@@ -39,37 +125,141 @@ class OutputLayer:
         )
         self.layer.startEditing()
         prov = self.layer.dataProvider()
-        prov.addAttributes(
-            [
-                QgsField(
-                    name=FIELD_NAME,
-                    type=QVariant.String,
-                    len=100
-                ),
-            ]
-        )
+        prov.addAttributes(node_fields().toList())
         self.layer.commitChanges()
+        self.create_attribute_indexes()
+        self.layer.willBeDeleted.connect(self._on_layer_deleted)
+
+    def _on_layer_deleted(self) -> None:
+        """Forget result layer removed from the project, it is created again on the next setup."""
+        self.layer = None
+
+    def create_attribute_indexes(self) -> None:
+        """Create attribute indexes of the node location fields if data provider supports them."""
+        prov = self.layer.dataProvider()
+        if not prov.capabilities() & QgsVectorDataProvider.CreateAttributeIndex:
+            return
+        for field_name in INDEXED_FIELDS:
+            prov.createAttributeIndex(prov.fieldNameIndex(field_name))
+
+    def create_spatial_index(self) -> None:
+        """Create spatial index of the nodes, once created it is updated by the data provider
+        when features are added, deleted or their geometry changed.
+        """
+        prov = self.layer.dataProvider()
+        if prov.hasSpatialIndex() != QgsFeatureSource.SpatialIndexPresent:
+            prov.createSpatialIndex()
 
     def set_labels(self) -> None:
-        """Set labels with coordinates to the output layer."""
+        """Set labels with coordinates to the output layer, limit labels rendering according to label settings."""
         labels_setting = QgsPalLayerSettings()
-        labels_setting.isExpression = True
+        # Plain field - label text is read from the attribute, no expression is evaluated
+        labels_setting.isExpression = False
         labels_setting.fieldName = FIELD_NAME
+
+        if self.label_settings.scale_visibility:
+            labels_setting.scaleVisibility = True
+            labels_setting.minimumScale = self.label_settings.min_scale
+            labels_setting.maximumScale = self.label_settings.max_scale
+
+        if self.label_settings.limit_labels:
+            thinning = labels_setting.thinningSettings()
+            thinning.setLimitNumberLabelsEnabled(True)
+            thinning.setMaximumNumberLabels(self.label_settings.max_labels)
+            labels_setting.setThinningSettings(thinning)
+
+        if self.label_settings.cheap_placement:
+            labels_setting.placement = QgsPalLayerSettings.OverPoint
+
+        # Nodes not significant at the current scale are not rendered nor labeled
+        lod_filter = QgsProperty.fromExpression(LOD_FILTER_EXPRESSION, self.label_settings.level_of_detail)
+        labels_setting.dataDefinedProperties().setProperty(QgsPalLayerSettings.Show, lod_filter)
+        for symbol_layer in self.layer.renderer().symbol().symbolLayers():
+            symbol_layer.setDataDefinedProperty(QgsSymbolLayer.PropertyLayerEnabled, lod_filter)
+
         lyr_set = QgsVectorLayerSimpleLabeling(labels_setting)
         self.layer.setLabelsEnabled(True)
         self.layer.setLabeling(lyr_set)
         self.layer.triggerRepaint()
 
+    def clear(self) -> None:
+        """Remove all node features from the output layer."""
+        self.layer.dataProvider().truncate()
+
+    def add_nodes(self, features: Iterable[QgsFeature]) -> int:
+        """Add node features to the output layer in batches of BATCH_SIZE features.
+        Features are written directly to the data provider, edit buffer is not used.
+
+        :param features: node features to be added
+        :return: number of added features
+        """
+        prov = self.layer.dataProvider()
+        features = iter(features)
+        added_count = 0
+        with StageTimer("Adding nodes to output layer") as timer:
+            while True:
+                batch = list(islice(features, BATCH_SIZE))
+                if not batch:
+                    break
+                prov.addFeatures(batch)
+                added_count += len(batch)
+
+            self.layer.updateExtents()
+            # Index is built once after the first bulk load, then it is maintained by the data provider
+            self.create_spatial_index()
+            timer.vertices = added_count
+        return added_count
+
     def is_registered(self) -> bool:
         """Check if result layer is added to the layer list in the current project - layer was created
          and not removed from layers list in QGIS Project."""
-        return bool(QgsProject.instance().mapLayersByName(self.name))
+        return self.layer is not None and QgsProject.instance().mapLayer(self.layer.id()) is not None
 
     def setup(self) -> None:
         """Prepare result layer for editing."""
-        if not self.name or not self.is_registered():
-            self.create()
+        with StageTimer("Output layer setup"):
+            if not self.is_registered():
+                self.create()
+                QgsProject.instance().addMapLayer(self.layer)
+
+        # Label settings might have changed since the last run
+        with StageTimer("Labeling setup"):
             self.set_labels()
-            QgsProject.instance().addMapLayer(self.layer)
 
         self.iface.setActiveLayer(self.layer)
+
+
+class OutputLayerRegistry:
+    """Output layers of the source layers, nodes of each source layer are shown in its own output layer.
+    Output layer is reused by the next runs on the same source layer until it is removed from the project,
+    registry entry is removed when source layer is deleted.
+    """
+
+    def __init__(self, iface: QgisInterface):
+        self.iface = iface
+        # Source layer id -> output layer
+        self.output_layers = {}
+
+    def __len__(self) -> int:
+        return len(self.output_layers)
+
+    def get(self, src_layer: QgsVectorLayer) -> OutputLayer:
+        """Return output layer of the source layer, output layer is created if source layer has none.
+
+        :param src_layer: source polygon layer
+        :return: output layer of the source layer, not set up if it is new
+        """
+        output_layer = self.output_layers.get(src_layer.id())
+        if output_layer is None:
+            output_layer = OutputLayer(self.iface)
+            self.output_layers[src_layer.id()] = output_layer
+            src_layer.willBeDeleted.connect(partial(self.remove, src_layer.id()))
+        return output_layer
+
+    def remove(self, src_layer_id: str) -> None:
+        """Forget output layer of the source layer, output layer itself stays in the project."""
+        self.output_layers.pop(src_layer_id, None)
+
+    def clear(self) -> None:
+        """Forget all output layers."""
+        self.output_layers.clear()
@@ -0,0 +1,117 @@
+"""Generating node features with coordinates formatted in worker processes, for layers with millions of nodes.
+
+Features are transformed to WGS84 in the calling thread and passed to the workers as WKB in chunks,
+workers decode and format them (see parallel_worker module) and node features are created from the results
+in the order of the source features.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator
+
+from qgis.core import QgsCoordinateTransform, QgsFeature, QgsFields, QgsWkbTypes
+
+from .coordinate_format import FORMAT_DMS
+from .crs_transform import to_wgs84
+from .nodes import coordinate_node_features, linear_geometry
+from .parallel_worker import format_chunk
+
+# Features are sent to the workers in chunks of about CHUNK_BYTES of WKB
+CHUNK_BYTES = 2 ** 20
+# Number of chunks queued for each worker, limits memory used by pending chunks and results
+CHUNKS_PER_WORKER = 2
+
+
+def python_executable() -> str:
+    """Return Python interpreter for the worker processes. In QGIS sys.executable is QGIS application,
+    not Python interpreter.
+    """
+    if os.path.basename(sys.executable).lower().startswith("python"):
+        return sys.executable
+    candidates = (
+        os.path.join(sys.exec_prefix, "python.exe"),
+        os.path.join(sys.exec_prefix, "bin", f"python{sys.version_info.major}.{sys.version_info.minor}"),
+        os.path.join(sys.exec_prefix, "bin", "python3")
+    )
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return sys.executable
+
+
+def create_executor(workers: int) -> ProcessPoolExecutor:
+    """Create pool of worker processes. Processes are spawned, not forked - forking QGIS application
+    with its threads is not safe.
+    """
+    context = multiprocessing.get_context("spawn")
+    context.set_executable(python_executable())
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context)
+
+
+def wkb_chunks(features: Iterable[QgsFeature],
+               transform: QgsCoordinateTransform | None = None) -> Iterator[list[tuple[int, bytes]]]:
+    """Yield chunks of feature id, WKB in WGS84 of the features. Curved geometries are sent as multipolygons
+    with the same nodes, workers decode only polygon/multipolygon WKB. Null geometry is sent as empty WKB.
+    """
+    chunk = []
+    chunk_bytes = 0
+    for feature in features:
+        geom = feature.geometry()
+        if geom.isNull():
+            wkb = b""
+        else:
+            geom = to_wgs84(geom, transform)
+            if QgsWkbTypes.isCurvedType(geom.wkbType()):
+                geom = linear_geometry(geom)
+            wkb = bytes(geom.asWkb())
+        chunk.append((feature.id(), wkb))
+        chunk_bytes += len(wkb)
+        if chunk_bytes >= CHUNK_BYTES:
+            yield chunk
+            chunk = []
+            chunk_bytes = 0
+    if chunk:
+        yield chunk
+
+
+def parallel_node_features(features: Iterable[QgsFeature],
+                           fields: QgsFields,
+                           coord_order: str,
+                           precision: int = 3,
+                           transform: QgsCoordinateTransform | None = None,
+                           workers: int = 2,
+                           coord_format: str = FORMAT_DMS,
+                           with_levels: bool = True) -> Iterator[QgsFeature]:
+    """Yield point feature with DMS coordinates for each node of each feature, the same as nodes.node_features,
+    coordinates are decoded and formatted by the worker processes.
+
+    :param features: polygon/multipolygon features
+    :param fields: fields of the output node features
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param transform: transformation of the features geometry to WGS84, None if features are in WGS84
+    :param workers: number of worker processes
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :param with_levels: False if importance levels are not needed, all nodes get level 0
+    :return: node features in WGS84
+    """
+    executor = create_executor(workers)
+    pending = deque()
+    try:
+        for chunk in wkb_chunks(features, transform):
+            pending.append(executor.submit(format_chunk, chunk, coord_order, precision, coord_format, with_levels))
+            if len(pending) >= workers * CHUNKS_PER_WORKER:
+                for result in pending.popleft().result():
+                    yield from coordinate_node_features(*result, fields)
+        while pending:
+            for result in pending.popleft().result():
+                yield from coordinate_node_features(*result, fields)
+    finally:
+        # Generator closed early, e.g. task canceled
+        for future in pending:
+            future.cancel()
+        executor.shutdown()
@@ -0,0 +1,34 @@
+"""Worker decoding and formatting chunks of polygon WKB in separate process.
+
+Module does not import QGIS, worker processes import only it and the pure Python modules it uses.
+"""
+from __future__ import annotations
+
+from array import array
+
+from .coordinate_format import FORMAT_DMS, compile_format
+from .lod import coordinate_levels
+from .wkb import PolygonCoordinates, decode_polygon_wkb
+
+
+def format_chunk(chunk: list[tuple[int, bytes]],
+                 coord_order: str,
+                 precision: int = 3,
+                 coord_format: str = FORMAT_DMS,
+                 with_levels: bool = True) -> list[tuple[int, PolygonCoordinates, array, list[str]]]:
+    """Decode node coordinates of the features, compute their importance levels and format them.
+
+    :param chunk: feature id, polygon/multipolygon WKB in WGS84 of the features
+    :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+    :param precision: number of decimal places of the last format component
+    :param coord_format: coordinate format, one of coordinate_format.FORMATS
+    :param with_levels: False if importance levels are not needed, all nodes get level 0
+    :return: feature id, node coordinates, node importance levels, formatted node coordinates of the features
+    """
+    format_func = compile_format(coord_format, coord_order, precision)
+    result = []
+    for feature_id, wkb in chunk:
+        coords = decode_polygon_wkb(wkb)
+        levels = coordinate_levels(coords) if with_levels else array("i", [0]) * len(coords.xs)
+        result.append((feature_id, coords, levels, format_func(coords.xs, coords.ys)))
+    return result
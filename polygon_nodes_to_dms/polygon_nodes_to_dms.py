@@ -24,29 +24,42 @@
 from __future__ import annotations
 
 import os.path
+import time
+from typing import TYPE_CHECKING
 
-from qgis.PyQt.QtCore import QSettings, QTranslator, QCoreApplication
+from qgis.PyQt.QtCore import Qt, QSettings, QTranslator, QCoreApplication
 from qgis.PyQt.QtGui import QIcon
 from qgis.PyQt.QtWidgets import QAction, QMessageBox, QWidget
 from qgis.core import (
     Qgis,
-    QgsCoordinateFormatter,
-    QgsFeature,
-    QgsPointXY,
+    QgsApplication,
+    QgsCoordinateTransform,
+    QgsCsException,
+    QgsMessageLog,
+    QgsProject,
     QgsVectorLayer,
+    QgsVectorLayerFeatureSource,
     QgsWkbTypes
 )
+from qgis.gui import QgsDockWidget
 
 # Initialize Qt resources from file resources.py
 from .resources import qInitResources
 # Import the code for the dialog
+from .coordinate_format import DEFAULT_CACHE_SIZE, DEFAULT_PRECISIONS, FORMATS, ORDER_XY, ORDER_YX, DMSCache
+from . import dms_expression
 from .errors import (
+    FeatureNotSelectedError,
     LayerNotSelectedError,
-    LayerNotPolygonMultiPolygonError,
-    OneFeatureNotSelectedError
+    LayerNotPolygonMultiPolygonError
 )
-from .output_layer import OutputLayer
-from .polygon_nodes_to_dms_dialog import PolygonNodesToDMSDialog
+from .nodes_provider import PolygonNodesToDMSProvider
+
+# Modules generating and showing nodes are imported when they are used, not when QGIS loads the plugin
+if TYPE_CHECKING:
+    from .label_settings import LabelSettings
+    from .nodes_task import NodesTask
+    from .output_layer import OutputLayer
 
 
 class PolygonNodesToDMS:
@@ -60,12 +73,41 @@ class PolygonNodesToDMS:
             application at run time.
         :type iface: QgsInterface
         """
-        self.output_layer = OutputLayer(iface)
+        # Output layers registry, dialog and translator are created when plugin is run the first time,
+        # not when QGIS loads the plugin
+        self.output_layers = None
+        self.dlg = None
+        self.dock = None
+        self.translator = None
         # Save reference to the QGIS interface
         self.iface = iface
         # initialize plugin directory
         self.plugin_dir = os.path.dirname(__file__)
-        # initialize locale
+
+        # Declare instance attributes
+        self.actions = []
+        # Set in initGui() when translator is installed
+        self.menu = None
+
+        # Check if plugin was started the first time in current QGIS session
+        # Must be set in initGui() to survive plugin reloads
+        self.first_start = None
+        # Currently running nodes generating task
+        self.task = None
+        self.provider = None
+        # Updates output layer on source layer geometry edits when live mode is on
+        self.live_updater = None
+        # Generates nodes in current map view when viewport mode is on
+        self.viewport_generator = None
+        # Shows nodes again on active layer selection changes when auto update is on
+        self.selection_updater = None
+        # Formatted coordinates cache, size can be changed with PolygonNodesToDMS/dms_cache_size setting
+        self.dms_cache = DMSCache(
+            QSettings().value('PolygonNodesToDMS/dms_cache_size', DEFAULT_CACHE_SIZE, type=int)
+        )
+
+    def install_translator(self) -> None:
+        """Install translator for the user locale if plugin translation exists."""
         locale = QSettings().value('locale/userLocale')[0:2]
         locale_path = os.path.join(
             self.plugin_dir,
@@ -77,14 +119,6 @@ class PolygonNodesToDMS:
             self.translator.load(locale_path)
             QCoreApplication.installTranslator(self.translator)
 
-        # Declare instance attributes
-        self.actions = []
-        self.menu = self.tr('&PolygonNodesToDMS')
-
-        # Check if plugin was started the first time in current QGIS session
-        # Must be set in initGui() to survive plugin reloads
-        self.first_start = None
-
     # noinspection PyMethodMayBeStatic
     def tr(self, message):
         """Get the translation for a string using Qt translation API.
@@ -174,8 +208,18 @@ class PolygonNodesToDMS:
 
         return action
 
+    def initProcessing(self):
+        """Register processing provider of the plugin."""
+        self.provider = PolygonNodesToDMSProvider()
+        QgsApplication.processingRegistry().addProvider(self.provider)
+
     def initGui(self):
         """Create the menu entries and toolbar icons inside the QGIS GUI."""
+        # Menu and actions are translated
+        self.install_translator()
+        self.menu = self.tr('&PolygonNodesToDMS')
+        self.initProcessing()
+        dms_expression.register()
 
         icon_path = ':/plugins/polygon_nodes_to_dms/icon.png'
         self.add_action(
@@ -184,27 +228,117 @@ class PolygonNodesToDMS:
             callback=self.run,
             parent=self.iface.mainWindow())
 
+        self.add_action(
+            icon_path,
+            text=self.tr('Clear DMS and nodes cache'),
+            callback=self.clear_dms_cache,
+            add_to_toolbar=False,
+            parent=self.iface.mainWindow())
+
         # will be set False in run()
         self.first_start = True
 
     def unload(self):
         """Removes the plugin menu item and icon from QGIS GUI."""
+        if self.task:
+            self.task.cancel()
+        self.stop_live_update()
+        self.stop_viewport_mode()
+        self.stop_selection_updates()
+        if self.dock:
+            self.iface.removeDockWidget(self.dock)
+            self.dock.deleteLater()
+        if self.output_layers is not None:
+            self.output_layers.clear()
+        dms_expression.unregister()
+        if self.provider:
+            QgsApplication.processingRegistry().removeProvider(self.provider)
         for action in self.actions:
             self.iface.removePluginMenu(
-                self.tr('&PolygonNodesToDMS'),
+                self.menu,
                 action)
             self.iface.removeToolBarIcon(action)
 
+    def clear_dms_cache(self) -> None:
+        """Clear formatted coordinates cache and nodes cache, show formatted coordinates cache statistics."""
+        self.iface.messageBar().pushMessage(
+            "PolygonNodesToDMS",
+            f"DMS cache cleared: {len(self.dms_cache)} entries, "
+            f"{self.dms_cache.hits} hits, {self.dms_cache.misses} misses.",
+            level=Qgis.Info
+        )
+        self.dms_cache.clear()
+        path = self.node_cache_path()
+        if path:
+            import sqlite3  # pylint: disable=import-outside-toplevel
+            from .node_cache import NodeCache  # pylint: disable=import-outside-toplevel
+
+            try:
+                with NodeCache(path) as node_cache:
+                    node_cache.clear()
+            except sqlite3.Error as e:
+                self.iface.messageBar().pushMessage(
+                    "PolygonNodesToDMS",
+                    f"Can't clear nodes cache {path}: {e}",
+                    level=Qgis.Warning
+                )
+
+    @staticmethod
+    def node_cache_path() -> str | None:
+        """Return path to the SQLite cache of the generated nodes, None if PolygonNodesToDMS/node_cache setting
+        is off. Path can be set with PolygonNodesToDMS/node_cache_path setting, cache is stored in QGIS profile
+        directory by default.
+        """
+        settings = QSettings()
+        if not settings.value('PolygonNodesToDMS/node_cache', True, type=bool):
+            return None
+        path = settings.value('PolygonNodesToDMS/node_cache_path', '', type=str)
+        if not path:
+            path = os.path.join(QgsApplication.qgisSettingsDirPath(), 'PolygonNodesToDMS', 'node_cache.sqlite')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
     def set_initial_plugin_state(self) -> None:
         """Initialize plugin state when opened."""
-        self.output_layer = OutputLayer(self.iface)
+        from .label_settings import LabelSettings  # pylint: disable=import-outside-toplevel
         self.dlg.radioButtonOrderLonLat.setChecked(True)
+        self.dlg.comboBoxFormat.setCurrentIndex(0)
+        self.set_default_precision()
+        self.dlg.checkBoxMergeSharedNodes.setChecked(False)
+        self.dlg.doubleSpinBoxTolerance.setValue(0.0)
+        self.dlg.checkBoxLiveUpdate.setChecked(self.live_updater is not None)
+        self.dlg.checkBoxViewportMode.setChecked(self.viewport_generator is not None)
+        self.dlg.checkBoxAutoUpdate.setChecked(self.selection_updater is not None)
+        self.set_label_settings(LabelSettings.read(QgsProject.instance()))
+
+    def set_label_settings(self, settings: LabelSettings) -> None:
+        """Show label settings in the dialog."""
+        self.dlg.checkBoxScaleVisibility.setChecked(settings.scale_visibility)
+        self.dlg.spinBoxMinScale.setValue(settings.min_scale)
+        self.dlg.spinBoxMaxScale.setValue(settings.max_scale)
+        self.dlg.checkBoxLimitLabels.setChecked(settings.limit_labels)
+        self.dlg.spinBoxMaxLabels.setValue(settings.max_labels)
+        self.dlg.checkBoxCheapPlacement.setChecked(settings.cheap_placement)
+        self.dlg.checkBoxLevelOfDetail.setChecked(settings.level_of_detail)
+
+    def get_label_settings(self) -> LabelSettings:
+        """Return label settings set in the dialog."""
+        from .label_settings import LabelSettings  # pylint: disable=import-outside-toplevel
+        return LabelSettings(
+            scale_visibility=self.dlg.checkBoxScaleVisibility.isChecked(),
+            min_scale=self.dlg.spinBoxMinScale.value(),
+            max_scale=self.dlg.spinBoxMaxScale.value(),
+            limit_labels=self.dlg.checkBoxLimitLabels.isChecked(),
+            max_labels=self.dlg.spinBoxMaxLabels.value(),
+            cheap_placement=self.dlg.checkBoxCheapPlacement.isChecked(),
+            level_of_detail=self.dlg.checkBoxLevelOfDetail.isChecked()
+        )
 
     @staticmethod
     def check_input(layer: QgsVectorLayer) -> bool | Exception:
         """Check input for generating nodes with coordinates in DMS formats:
         - selected layer geometry type must be Polygon/MultiPolygon
-        - only one feature must be selected
+        - at least one feature must be selected
 
         Raise corresponding exception if requirement is not met (LayerNotPolygonMultiPolygonError etc.).
 
@@ -216,25 +350,40 @@ class PolygonNodesToDMS:
         if layer.wkbType() not in [QgsWkbTypes.Polygon, QgsWkbTypes.MultiPolygon]:
             raise LayerNotPolygonMultiPolygonError
 
-        selected_count = layer.selectedFeatureCount()
-        if selected_count != 1:
-            raise OneFeatureNotSelectedError
+        if layer.selectedFeatureCount() == 0:
+            raise FeatureNotSelectedError
 
         return True
 
-    def get_coordinate_order(self) -> Qgis.CoordinateOrder:
+    def get_coordinate_order(self) -> str:
         """Return coordinate order lon/lat or lat/lon.
 
-        :return: order XY if lon/lat, order YX if lat/lon of Qgis.CoordinateOrder
+        :return: ORDER_XY if lon/lat, ORDER_YX if lat/lon
         """
         if self.dlg.radioButtonOrderLonLat.isChecked():
-            return Qgis.CoordinateOrder.XY
+            return ORDER_XY
 
         # only radioButtonOrderLatLon can be checked
-        return Qgis.CoordinateOrder.YX
+        return ORDER_YX
+
+    def get_coordinate_format(self) -> str:
+        """Return coordinate format selected in the dialog, one of coordinate_format.FORMATS."""
+        # Combo box items are in the same order as FORMATS
+        return FORMATS[self.dlg.comboBoxFormat.currentIndex()]
+
+    def set_default_precision(self, *args) -> None:  # pylint: disable=unused-argument
+        """Set precision to the default precision of the selected coordinate format."""
+        self.dlg.spinBoxPrecision.setValue(DEFAULT_PRECISIONS[self.get_coordinate_format()])
 
     def show_nodes_dms(self) -> None:
         """Generate and display polygon nodes coordinates in DMS format."""
+        # pylint: disable=import-outside-toplevel
+        from .crs_transform import wgs84_transform
+        from .node_cache import MAX_FEATURES
+        from .nodes_task import NodesTask
+        from .output_layer import node_fields
+        from .stage_timer import LOG_TAG, RunProfiler, StageTimer
+
         canvas = self.iface.mapCanvas()
         src_layer = canvas.currentLayer()
 
@@ -245,38 +394,233 @@ class PolygonNodesToDMS:
             QMessageBox.critical(QWidget(), "Message", "No active layer.")
         except LayerNotPolygonMultiPolygonError:
             QMessageBox.critical(QWidget(), "Message", "Active layer is not type: Polygon, Multipolygon.")
-        except OneFeatureNotSelectedError:
-            QMessageBox.critical(QWidget(), "Message", "Select one polygon")
+        except FeatureNotSelectedError:
+            QMessageBox.critical(QWidget(), "Message", "Select at least one polygon.")
 
         if not check_result:
             return
 
-        selected_feature = src_layer.selectedFeatures()[0]
-        geom = selected_feature.geometry()
-        self.output_layer.setup()
-        coord_order = self.get_coordinate_order()
-        feat = QgsFeature()
-        prov = self.output_layer.layer.dataProvider()
-        self.output_layer.layer.startEditing()
-        # Remove previous node coordinates
-        prov.truncate()
-        for node_location in geom.vertices():
-            dms = QgsCoordinateFormatter.format(
-                point=QgsPointXY(node_location),
-                format=QgsCoordinateFormatter.FormatDegreesMinutesSeconds,
-                precision=3,
-                order=coord_order
+        if self.task:
+            self.task.cancel()
+        self.stop_live_update()
+        self.stop_viewport_mode()
+
+        if self.dlg.checkBoxViewportMode.isChecked():
+            with RunProfiler("viewport_nodes"), StageTimer("Generating nodes in view"):
+                self.start_viewport_mode(src_layer)
+            return
+
+        QgsMessageLog.logMessage(
+            f"Generating nodes of {src_layer.selectedFeatureCount()} features of layer {src_layer.name()}",
+            LOG_TAG,
+            level=Qgis.Info
+        )
+        self.task = NodesTask(
+            source=QgsVectorLayerFeatureSource(src_layer),
+            feature_ids=src_layer.selectedFeatureIds(),
+            fields=node_fields(),
+            coord_order=self.get_coordinate_order(),
+            on_finished=self.on_nodes_task_finished,
+            merge_shared=self.dlg.checkBoxMergeSharedNodes.isChecked(),
+            tolerance=self.dlg.doubleSpinBoxTolerance.value(),
+            cache=self.dms_cache,
+            transform=wgs84_transform(src_layer.crs(), QgsProject.instance().transformContext()),
+            workers=QSettings().value('PolygonNodesToDMS/workers', 1, type=int),
+            node_cache_path=self.node_cache_path(),
+            node_cache_max_features=QSettings().value(
+                'PolygonNodesToDMS/node_cache_max_features', MAX_FEATURES, type=int
+            ),
+            layer_source=src_layer.source(),
+            precision=self.dlg.spinBoxPrecision.value(),
+            coord_format=self.get_coordinate_format(),
+            layer_id=src_layer.id(),
+            # Levels are used only to filter nodes by scale
+            with_levels=self.dlg.checkBoxLevelOfDetail.isChecked()
+        )
+        QgsApplication.taskManager().addTask(self.task)
+
+    def on_nodes_task_finished(self, task: NodesTask, result: bool) -> None:
+        """Handle finished nodes generating task. Results of the tasks replaced by newer task are ignored.
+
+        :param task: finished nodes generating task
+        :param result: True if task generated nodes successfully
+        """
+        if task is not self.task:
+            return
+        self.task = None
+        if result:
+            self.add_nodes_to_output_layer(task)
+        elif task.exception:
+            QMessageBox.critical(QWidget(), "Message", f"Generating nodes failed: {task.exception}")
+
+    def label_nodes_on_layer(self) -> None:
+        """Label nodes of the active layer at render time with format_coordinates expression function."""
+        src_layer = self.iface.mapCanvas().currentLayer()
+        if not src_layer:
+            QMessageBox.critical(QWidget(), "Message", "No active layer.")
+            return
+        if src_layer.wkbType() not in [QgsWkbTypes.Polygon, QgsWkbTypes.MultiPolygon]:
+            QMessageBox.critical(QWidget(), "Message", "Active layer is not type: Polygon, Multipolygon.")
+            return
+        dms_expression.apply_node_labels_style(
+            src_layer,
+            self.get_coordinate_order(),
+            self.dlg.spinBoxPrecision.value(),
+            self.get_coordinate_format()
+        )
+
+    def start_viewport_mode(self, src_layer: QgsVectorLayer) -> None:
+        """Generate nodes of the selected features only in the current map view, follow map extent changes."""
+        from .viewport_nodes import ViewportNodesGenerator  # pylint: disable=import-outside-toplevel
+        output_layer = self.output_layers.get(src_layer)
+        output_layer.label_settings = self.get_label_settings()
+        output_layer.label_settings.write(QgsProject.instance())
+        output_layer.setup()
+        output_layer.clear()
+        self.viewport_generator = ViewportNodesGenerator(
+            self.iface,
+            src_layer,
+            src_layer.selectedFeatureIds(),
+            output_layer,
+            self.get_coordinate_order(),
+            cache=self.dms_cache,
+            precision=self.dlg.spinBoxPrecision.value(),
+            coord_format=self.get_coordinate_format()
+        )
+        self.viewport_generator.update()
+        self.iface.setActiveLayer(src_layer)
+
+    def stop_viewport_mode(self) -> None:
+        """Stop generating nodes on map extent changes."""
+        if self.viewport_generator:
+            self.viewport_generator.stop()
+            self.viewport_generator = None
+
+    def toggle_selection_updates(self, enabled: bool) -> None:
+        """Start or stop showing nodes automatically when selection of the active layer changes."""
+        self.stop_selection_updates()
+        if enabled:
+            from .selection_updater import SelectionNodesUpdater  # pylint: disable=import-outside-toplevel
+            self.selection_updater = SelectionNodesUpdater(self.iface, self.show_nodes_dms)
+
+    def stop_selection_updates(self) -> None:
+        """Stop showing nodes on selection changes."""
+        if self.selection_updater:
+            self.selection_updater.stop()
+            self.selection_updater = None
+
+    def stop_live_update(self) -> None:
+        """Stop updating output layer on source layer geometry edits."""
+        if self.live_updater:
+            self.live_updater.stop()
+            self.live_updater = None
+
+    def on_dock_closed(self) -> None:
+        """Stop updating nodes when the plugin dock widget is closed, nodes already shown stay in output layers."""
+        # Unchecking stops selection updates
+        self.dlg.checkBoxAutoUpdate.setChecked(False)
+        self.stop_selection_updates()
+        self.stop_live_update()
+        self.stop_viewport_mode()
+
+    def add_nodes_to_output_layer(self, task: NodesTask) -> None:
+        """Add node features generated by the task to the output layer and show them on the map canvas.
+
+        :param task: finished nodes generating task
+        """
+        # pylint: disable=import-outside-toplevel
+        from .live_update import LiveNodesUpdater
+        from .stage_timer import RunProfiler
+
+        src_layer = QgsProject.instance().mapLayer(task.layer_id)
+        if src_layer is None:
+            # Source layer removed while nodes were generated
+            return
+        output_layer = self.output_layers.get(src_layer)
+        output_layer.label_settings = self.get_label_settings()
+        output_layer.label_settings.write(QgsProject.instance())
+        with RunProfiler("output_layer"):
+            output_layer.setup()
+            # Remove previous node coordinates
+            output_layer.clear()
+            nodes_count = output_layer.add_nodes(task.nodes)
+        if self.dlg.checkBoxLiveUpdate.isChecked() and not task.merge_shared:
+            self.live_updater = LiveNodesUpdater(
+                src_layer,
+                output_layer,
+                task.coord_order,
+                task.precision,
+                cache=self.dms_cache,
+                coord_format=task.coord_format,
+                with_levels=task.with_levels
             )
-            feat.setGeometry(node_location)
-            feat.setAttributes([dms])
-            prov.addFeatures([feat])
-
-        self.output_layer.layer.commitChanges()
-        self.output_layer.layer.updateExtents()
-        self.iface.mapCanvas().setExtent(self.output_layer.layer.extent())
-        self.iface.mapCanvas().refresh()
+
+        self.iface.messageBar().pushMessage(
+            "PolygonNodesToDMS",
+            f"{nodes_count} nodes of {task.processed_features_count} features generated in {task.elapsed:.3f} s "
+            f"(DMS cache: {self.dms_cache.hits} hits, {self.dms_cache.misses} misses; "
+            f"nodes cache: {task.node_cache_hits} features).",
+            level=Qgis.Info
+        )
+        self.show_output_layer(output_layer)
         self.iface.setActiveLayer(src_layer)
 
+    def show_output_layer(self, output_layer: OutputLayer) -> None:
+        """Redraw output layer only. Map is zoomed to the nodes only if they are not in the current map view
+        and PolygonNodesToDMS/zoom_to_nodes setting is on (default), other layers are redrawn only then.
+        Map is not zoomed if there are no nodes or their extent can't be transformed to the map CRS,
+        nothing is redrawn if output layer is hidden.
+
+        :param output_layer: output layer with added nodes
+        """
+        from .stage_timer import LOG_TAG  # pylint: disable=import-outside-toplevel
+
+        canvas = self.iface.mapCanvas()
+        layer = output_layer.layer
+        nodes_extent = None
+        if layer.featureCount():
+            transform = QgsCoordinateTransform(
+                layer.crs(), canvas.mapSettings().destinationCrs(), QgsProject.instance()
+            )
+            try:
+                nodes_extent = transform.transformBoundingBox(layer.extent())
+            except QgsCsException as e:
+                QgsMessageLog.logMessage(
+                    f"Nodes extent can't be transformed to the map CRS, map is not zoomed: {e}",
+                    LOG_TAG,
+                    level=Qgis.Warning
+                )
+        zoom_to_nodes = QSettings().value('PolygonNodesToDMS/zoom_to_nodes', True, type=bool)
+        zoom = zoom_to_nodes and nodes_extent is not None and not canvas.extent().contains(nodes_extent)
+
+        if zoom:
+            redraw_scope = "all layers, zoomed to nodes"
+        elif layer in canvas.layers():
+            # With render cache on only output layer is rendered again
+            redraw_scope = "output layer only"
+        else:
+            # Hidden layer is not rendered, map is not redrawn
+            return
+
+        start = time.perf_counter()
+
+        def log_redraw_time():
+            canvas.mapCanvasRefreshed.disconnect(log_redraw_time)
+            QgsMessageLog.logMessage(
+                f"Map redrawn in {time.perf_counter() - start:.3f} s ({redraw_scope}).",
+                LOG_TAG,
+                level=Qgis.Info
+            )
+
+        # Frozen canvas or canvas with rendering off is not redrawn now, handler would stay connected
+        if canvas.renderFlag() and not canvas.isFrozen():
+            canvas.mapCanvasRefreshed.connect(log_redraw_time)
+        if zoom:
+            canvas.setExtent(nodes_extent)
+            canvas.refresh()
+        else:
+            layer.triggerRepaint()
+
     def run(self):
         """Run method that performs all the real work"""
 
@@ -284,17 +628,27 @@ class PolygonNodesToDMS:
         # Only create GUI ONCE in callback, so that it will only load when the plugin is started
         if self.first_start:
             self.first_start = False
+            # Dialog and output layer modules are imported on first run only
+            # pylint: disable=import-outside-toplevel
+            from .output_layer import OutputLayerRegistry
+            from .polygon_nodes_to_dms_dialog import PolygonNodesToDMSDialog
+            self.output_layers = OutputLayerRegistry(self.iface)
             self.dlg = PolygonNodesToDMSDialog()
+            # Dialog is embedded in the dock widget, map can be used while it is open
+            self.dlg.setWindowFlags(Qt.Widget)
+            self.dock = QgsDockWidget(self.tr('PolygonNodesToDMS'), self.iface.mainWindow())
+            self.dock.setObjectName('PolygonNodesToDMSDock')
+            self.dock.setWidget(self.dlg)
+            self.iface.addDockWidget(Qt.RightDockWidgetArea, self.dock)
             self.dlg.pushButtonShowNodes.clicked.connect(self.show_nodes_dms)
-            self.dlg.pushButtonCancel.clicked.connect(self.dlg.close)
-
-        # show the dialog
+            self.dlg.pushButtonLabelLayer.clicked.connect(self.label_nodes_on_layer)
+            self.dlg.pushButtonCancel.clicked.connect(self.dock.close)
+            self.dock.closed.connect(self.on_dock_closed)
+            self.set_initial_plugin_state()
+            self.dlg.checkBoxAutoUpdate.toggled.connect(self.toggle_selection_updates)
+            self.dlg.comboBoxFormat.currentIndexChanged.connect(self.set_default_precision)
+
+        # show the dock widget
         self.dlg.show()
-        self.set_initial_plugin_state()
-        # Run the dialog event loop
-        result = self.dlg.exec_()
-        # See if OK was pressed
-        if result:
-            # Do something useful here - delete the line containing pass and
-            # substitute with your code.
-            pass
+        self.dock.show()
+        self.dock.raise_()
@@ -22,14 +22,11 @@
  ***************************************************************************/
 """
 
-import os
-
-from qgis.PyQt import uic
 from qgis.PyQt import QtWidgets
 
-# This loads your .ui file so that PyQt can populate your plugin with the elements from Qt Designer
-FORM_CLASS, _ = uic.loadUiType(os.path.join(
-    os.path.dirname(__file__), 'polygon_nodes_to_dms_dialog_base.ui'))
+# UI class compiled from polygon_nodes_to_dms_dialog_base.ui with pyuic5 (make compile),
+# .ui file is not parsed when plugin is loaded
+from .polygon_nodes_to_dms_dialog_base import Ui_PolygonNodesToDMSDialogBase as FORM_CLASS
 
 
 class PolygonNodesToDMSDialog(QtWidgets.QDialog, FORM_CLASS):
@@ -42,3 +39,8 @@ class PolygonNodesToDMSDialog(QtWidgets.QDialog, FORM_CLASS):
         # http://qt-project.org/doc/qt-4.8/designer-using-a-ui-file.html
         # #widgets-and-dialogs-with-auto-connect
         self.setupUi(self)
+
+    def reject(self):
+        """Keep dialog visible on Esc key - dialog is embedded in the plugin dock widget, which is closed
+        with Cancel button. Hidden dialog would leave the dock empty.
+        """
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+
+# Form implementation generated from reading ui file 'polygon_nodes_to_dms_dialog_base.ui'
+#
+# Created by: PyQt5 UI code generator 5.15.4
+#
+# WARNING: Any manual changes made to this file will be lost when pyuic5 is
+# run again.  Do not edit this file unless you know what you are doing.
+
+
+from qgis.PyQt import QtCore, QtGui, QtWidgets
+
+
+class Ui_PolygonNodesToDMSDialogBase(object):
+    def setupUi(self, PolygonNodesToDMSDialogBase):
+        PolygonNodesToDMSDialogBase.setObjectName("PolygonNodesToDMSDialogBase")
+        PolygonNodesToDMSDialogBase.resize(458, 565)
+        self.groupBoxCoordinateOrder = QtWidgets.QGroupBox(PolygonNodesToDMSDialogBase)
+        self.groupBoxCoordinateOrder.setGeometry(QtCore.QRect(20, 20, 411, 91))
+        self.groupBoxCoordinateOrder.setObjectName("groupBoxCoordinateOrder")
+        self.radioButtonOrderLonLat = QtWidgets.QRadioButton(self.groupBoxCoordinateOrder)
+        self.radioButtonOrderLonLat.setGeometry(QtCore.QRect(20, 30, 151, 20))
+        self.radioButtonOrderLonLat.setObjectName("radioButtonOrderLonLat")
+        self.radioButtonOrderLatLon = QtWidgets.QRadioButton(self.groupBoxCoordinateOrder)
+        self.radioButtonOrderLatLon.setGeometry(QtCore.QRect(250, 30, 161, 20))
+        self.radioButtonOrderLatLon.setObjectName("radioButtonOrderLatLon")
+        self.labelFormat = QtWidgets.QLabel(self.groupBoxCoordinateOrder)
+        self.labelFormat.setGeometry(QtCore.QRect(20, 60, 61, 20))
+        self.labelFormat.setObjectName("labelFormat")
+        self.comboBoxFormat = QtWidgets.QComboBox(self.groupBoxCoordinateOrder)
+        self.comboBoxFormat.setGeometry(QtCore.QRect(80, 58, 191, 24))
+        self.comboBoxFormat.setObjectName("comboBoxFormat")
+        self.comboBoxFormat.addItem("")
+        self.comboBoxFormat.addItem("")
+        self.comboBoxFormat.addItem("")
+        self.comboBoxFormat.addItem("")
+        self.labelPrecision = QtWidgets.QLabel(self.groupBoxCoordinateOrder)
+        self.labelPrecision.setGeometry(QtCore.QRect(280, 60, 61, 20))
+        self.labelPrecision.setObjectName("labelPrecision")
+        self.spinBoxPrecision = QtWidgets.QSpinBox(self.groupBoxCoordinateOrder)
+        self.spinBoxPrecision.setGeometry(QtCore.QRect(341, 58, 50, 24))
+        self.spinBoxPrecision.setMaximum(10)
+        self.spinBoxPrecision.setProperty("value", 3)
+        self.spinBoxPrecision.setObjectName("spinBoxPrecision")
+        self.groupBoxSharedNodes = QtWidgets.QGroupBox(PolygonNodesToDMSDialogBase)
+        self.groupBoxSharedNodes.setGeometry(QtCore.QRect(20, 120, 411, 91))
+        self.groupBoxSharedNodes.setObjectName("groupBoxSharedNodes")
+        self.checkBoxMergeSharedNodes = QtWidgets.QCheckBox(self.groupBoxSharedNodes)
+        self.checkBoxMergeSharedNodes.setGeometry(QtCore.QRect(20, 30, 371, 20))
+        self.checkBoxMergeSharedNodes.setObjectName("checkBoxMergeSharedNodes")
+        self.labelTolerance = QtWidgets.QLabel(self.groupBoxSharedNodes)
+        self.labelTolerance.setGeometry(QtCore.QRect(20, 60, 171, 20))
+        self.labelTolerance.setObjectName("labelTolerance")
+        self.doubleSpinBoxTolerance = QtWidgets.QDoubleSpinBox(self.groupBoxSharedNodes)
+        self.doubleSpinBoxTolerance.setGeometry(QtCore.QRect(250, 58, 141, 24))
+        self.doubleSpinBoxTolerance.setDecimals(8)
+        self.doubleSpinBoxTolerance.setMaximum(1.0)
+        self.doubleSpinBoxTolerance.setSingleStep(1e-06)
+        self.doubleSpinBoxTolerance.setObjectName("doubleSpinBoxTolerance")
+        self.checkBoxLiveUpdate = QtWidgets.QCheckBox(PolygonNodesToDMSDialogBase)
+        self.checkBoxLiveUpdate.setGeometry(QtCore.QRect(40, 225, 391, 20))
+        self.checkBoxLiveUpdate.setObjectName("checkBoxLiveUpdate")
+        self.groupBoxLabels = QtWidgets.QGroupBox(PolygonNodesToDMSDialogBase)
+        self.groupBoxLabels.setGeometry(QtCore.QRect(20, 255, 411, 191))
+        self.groupBoxLabels.setObjectName("groupBoxLabels")
+        self.checkBoxScaleVisibility = QtWidgets.QCheckBox(self.groupBoxLabels)
+        self.checkBoxScaleVisibility.setGeometry(QtCore.QRect(20, 30, 371, 20))
+        self.checkBoxScaleVisibility.setObjectName("checkBoxScaleVisibility")
+        self.labelMinScale = QtWidgets.QLabel(self.groupBoxLabels)
+        self.labelMinScale.setGeometry(QtCore.QRect(20, 60, 61, 20))
+        self.labelMinScale.setObjectName("labelMinScale")
+        self.spinBoxMinScale = QtWidgets.QSpinBox(self.groupBoxLabels)
+        self.spinBoxMinScale.setGeometry(QtCore.QRect(80, 58, 111, 24))
+        self.spinBoxMinScale.setMaximum(100000000)
+        self.spinBoxMinScale.setSingleStep(1000)
+        self.spinBoxMinScale.setValue(100000)
+        self.spinBoxMinScale.setObjectName("spinBoxMinScale")
+        self.labelMaxScale = QtWidgets.QLabel(self.groupBoxLabels)
+        self.labelMaxScale.setGeometry(QtCore.QRect(210, 60, 61, 20))
+        self.labelMaxScale.setObjectName("labelMaxScale")
+        self.spinBoxMaxScale = QtWidgets.QSpinBox(self.groupBoxLabels)
+        self.spinBoxMaxScale.setGeometry(QtCore.QRect(280, 58, 111, 24))
+        self.spinBoxMaxScale.setMaximum(100000000)
+        self.spinBoxMaxScale.setSingleStep(1000)
+        self.spinBoxMaxScale.setObjectName("spinBoxMaxScale")
+        self.checkBoxLimitLabels = QtWidgets.QCheckBox(self.groupBoxLabels)
+        self.checkBoxLimitLabels.setGeometry(QtCore.QRect(20, 95, 241, 20))
+        self.checkBoxLimitLabels.setObjectName("checkBoxLimitLabels")
+        self.spinBoxMaxLabels = QtWidgets.QSpinBox(self.groupBoxLabels)
+        self.spinBoxMaxLabels.setGeometry(QtCore.QRect(280, 93, 111, 24))
+        self.spinBoxMaxLabels.setMinimum(1)
+        self.spinBoxMaxLabels.setMaximum(1000000)
+        self.spinBoxMaxLabels.setSingleStep(100)
+        self.spinBoxMaxLabels.setValue(2000)
+        self.spinBoxMaxLabels.setObjectName("spinBoxMaxLabels")
+        self.checkBoxCheapPlacement = QtWidgets.QCheckBox(self.groupBoxLabels)
+        self.checkBoxCheapPlacement.setGeometry(QtCore.QRect(20, 128, 371, 20))
+        self.checkBoxCheapPlacement.setObjectName("checkBoxCheapPlacement")
+        self.checkBoxLevelOfDetail = QtWidgets.QCheckBox(self.groupBoxLabels)
+        self.checkBoxLevelOfDetail.setGeometry(QtCore.QRect(20, 160, 371, 20))
+        self.checkBoxLevelOfDetail.setObjectName("checkBoxLevelOfDetail")
+        self.checkBoxViewportMode = QtWidgets.QCheckBox(PolygonNodesToDMSDialogBase)
+        self.checkBoxViewportMode.setGeometry(QtCore.QRect(40, 455, 391, 20))
+        self.checkBoxViewportMode.setObjectName("checkBoxViewportMode")
+        self.checkBoxAutoUpdate = QtWidgets.QCheckBox(PolygonNodesToDMSDialogBase)
+        self.checkBoxAutoUpdate.setGeometry(QtCore.QRect(40, 480, 391, 20))
+        self.checkBoxAutoUpdate.setObjectName("checkBoxAutoUpdate")
+        self.pushButtonShowNodes = QtWidgets.QPushButton(PolygonNodesToDMSDialogBase)
+        self.pushButtonShowNodes.setGeometry(QtCore.QRect(30, 515, 93, 28))
+        self.pushButtonShowNodes.setObjectName("pushButtonShowNodes")
+        self.pushButtonLabelLayer = QtWidgets.QPushButton(PolygonNodesToDMSDialogBase)
+        self.pushButtonLabelLayer.setGeometry(QtCore.QRect(140, 515, 181, 28))
+        self.pushButtonLabelLayer.setObjectName("pushButtonLabelLayer")
+        self.pushButtonCancel = QtWidgets.QPushButton(PolygonNodesToDMSDialogBase)
+        self.pushButtonCancel.setGeometry(QtCore.QRect(340, 515, 93, 28))
+        self.pushButtonCancel.setObjectName("pushButtonCancel")
+
+        self.retranslateUi(PolygonNodesToDMSDialogBase)
+        QtCore.QMetaObject.connectSlotsByName(PolygonNodesToDMSDialogBase)
+
+    def retranslateUi(self, PolygonNodesToDMSDialogBase):
+        _translate = QtCore.QCoreApplication.translate
+        PolygonNodesToDMSDialogBase.setWindowTitle(_translate("PolygonNodesToDMSDialogBase", "PolygonNodesToDMS"))
+        self.groupBoxCoordinateOrder.setTitle(_translate("PolygonNodesToDMSDialogBase", "Coordinates"))
+        self.radioButtonOrderLonLat.setText(_translate("PolygonNodesToDMSDialogBase", "Longitude, latitude"))
+        self.radioButtonOrderLatLon.setText(_translate("PolygonNodesToDMSDialogBase", "Latitude, longitude"))
+        self.labelFormat.setText(_translate("PolygonNodesToDMSDialogBase", "Format:"))
+        self.comboBoxFormat.setItemText(0, _translate("PolygonNodesToDMSDialogBase", "Degrees, minutes, seconds"))
+        self.comboBoxFormat.setItemText(1, _translate("PolygonNodesToDMSDialogBase", "Degrees, decimal minutes"))
+        self.comboBoxFormat.setItemText(2, _translate("PolygonNodesToDMSDialogBase", "Decimal degrees"))
+        self.comboBoxFormat.setItemText(3, _translate("PolygonNodesToDMSDialogBase", "DDMMSS.ssN DDDMMSS.ssE"))
+        self.labelPrecision.setToolTip(_translate("PolygonNodesToDMSDialogBase", "Number of decimal places of seconds, minutes or degrees"))
+        self.labelPrecision.setText(_translate("PolygonNodesToDMSDialogBase", "Precision:"))
+        self.groupBoxSharedNodes.setTitle(_translate("PolygonNodesToDMSDialogBase", "Shared nodes"))
+        self.checkBoxMergeSharedNodes.setText(_translate("PolygonNodesToDMSDialogBase", "Merge nodes shared by selected polygons"))
+        self.labelTolerance.setText(_translate("PolygonNodesToDMSDialogBase", "Tolerance (degrees):"))
+        self.checkBoxLiveUpdate.setText(_translate("PolygonNodesToDMSDialogBase", "Update nodes on geometry edits (without merging shared nodes)"))
+        self.groupBoxLabels.setTitle(_translate("PolygonNodesToDMSDialogBase", "Labels"))
+        self.checkBoxScaleVisibility.setText(_translate("PolygonNodesToDMSDialogBase", "Show labels only between scales"))
+        self.labelMinScale.setText(_translate("PolygonNodesToDMSDialogBase", "Min 1:"))
+        self.labelMaxScale.setText(_translate("PolygonNodesToDMSDialogBase", "Max 1:"))
+        self.checkBoxLimitLabels.setText(_translate("PolygonNodesToDMSDialogBase", "Limit number of labels on map to"))
+        self.checkBoxCheapPlacement.setText(_translate("PolygonNodesToDMSDialogBase", "Fast placement (label over node)"))
+        self.checkBoxLevelOfDetail.setText(_translate("PolygonNodesToDMSDialogBase", "Show only nodes significant at current scale"))
+        self.checkBoxViewportMode.setText(_translate("PolygonNodesToDMSDialogBase", "Generate nodes only in current map view"))
+        self.checkBoxAutoUpdate.setText(_translate("PolygonNodesToDMSDialogBase", "Show nodes automatically when selection changes"))
+        self.pushButtonShowNodes.setText(_translate("PolygonNodesToDMSDialogBase", "Show nodes"))
+        self.pushButtonLabelLayer.setToolTip(_translate("PolygonNodesToDMSDialogBase", "Label nodes of the active layer at render time, without creating nodes layer"))
+        self.pushButtonLabelLayer.setText(_translate("PolygonNodesToDMSDialogBase", "Label nodes on layer"))
+        self.pushButtonCancel.setText(_translate("PolygonNodesToDMSDialogBase", "Cancel"))
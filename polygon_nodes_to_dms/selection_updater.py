@@ -0,0 +1,101 @@
+"""Showing nodes again when selection of the active layer changes."""
+from __future__ import annotations
+
+import hashlib
+from typing import Callable
+
+from qgis.core import QgsFeatureRequest, QgsMapLayer, QgsVectorLayer, QgsWkbTypes
+from qgis.gui import QgisInterface
+from qgis.PyQt.QtCore import QTimer
+
+# Delay after the last selection change before nodes are shown, ms
+DEBOUNCE_INTERVAL = 500
+
+
+def selection_hash(layer: QgsVectorLayer) -> str:
+    """Return hash of the ids and geometries of the selected features of the layer."""
+    digest = hashlib.blake2b(layer.id().encode(), digest_size=16)
+    request = QgsFeatureRequest().setNoAttributes()
+    for feature in layer.getSelectedFeatures(request):
+        digest.update(feature.id().to_bytes(8, "little", signed=True))
+        digest.update(bytes(feature.geometry().asWkb()))
+    return digest.hexdigest()
+
+
+def is_polygon_layer(layer: QgsMapLayer | None) -> bool:
+    """Check if layer is polygon/multipolygon vector layer."""
+    return (
+        isinstance(layer, QgsVectorLayer)
+        and QgsWkbTypes.geometryType(layer.wkbType()) == QgsWkbTypes.PolygonGeometry
+    )
+
+
+class SelectionNodesUpdater:
+    """Call on_selection_changed when selection of the active polygon layer changes.
+    Rapid selection changes are coalesced - callback is called once DEBOUNCE_INTERVAL ms after the last change,
+    and only if selected features or their geometries differ from the ones of the previous call.
+    Empty selection is ignored.
+    """
+
+    def __init__(self, iface: QgisInterface, on_selection_changed: Callable[[], None]):
+        """
+        :param iface: QGIS interface
+        :param on_selection_changed: called with active layer selection changed, e.g. showing nodes
+        """
+        self.iface = iface
+        self.on_selection_changed = on_selection_changed
+        self.layer = None
+        self.last_hash = None
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_INTERVAL)
+        self.timer.timeout.connect(self.update)
+        self.iface.currentLayerChanged.connect(self.set_layer)
+        self.set_layer(self.iface.activeLayer())
+
+    def set_layer(self, layer: QgsMapLayer | None) -> None:
+        """Follow selection of the layer if it is polygon layer, otherwise keep following previous layer."""
+        if not is_polygon_layer(layer) or layer is self.layer:
+            return
+        self._disconnect_layer()
+        self.layer = layer
+        self.layer.selectionChanged.connect(self.schedule_update)
+        self.layer.willBeDeleted.connect(self._disconnect_layer)
+
+    def _disconnect_layer(self) -> None:
+        """Stop following selection of the current layer."""
+        self.timer.stop()
+        if self.layer is None:
+            return
+        try:
+            self.layer.selectionChanged.disconnect(self.schedule_update)
+            self.layer.willBeDeleted.disconnect(self._disconnect_layer)
+        except (RuntimeError, TypeError):
+            # Layer already deleted
+            pass
+        self.layer = None
+
+    def schedule_update(self, *args) -> None:  # pylint: disable=unused-argument
+        """Restart debounce timer, update is done when selection does not change for DEBOUNCE_INTERVAL ms."""
+        self.timer.start()
+
+    def update(self) -> None:
+        """Call on_selection_changed if layer is still active, its selection is not empty
+        and changed since the last call.
+        """
+        if self.layer is None or self.iface.activeLayer() is not self.layer or not self.layer.selectedFeatureCount():
+            return
+        current_hash = selection_hash(self.layer)
+        if current_hash == self.last_hash:
+            return
+        self.last_hash = current_hash
+        self.on_selection_changed()
+
+    def stop(self) -> None:
+        """Stop following selection changes."""
+        self._disconnect_layer()
+        try:
+            self.iface.currentLayerChanged.disconnect(self.set_layer)
+        except (RuntimeError, TypeError):
+            pass
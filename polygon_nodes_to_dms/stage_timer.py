@@ -0,0 +1,97 @@
+"""Timing of the plugin stages and optional profiling, results are logged to the QGIS message log."""
+from __future__ import annotations
+
+import cProfile
+import os
+import threading
+import time
+from datetime import datetime
+
+from qgis.core import Qgis, QgsMessageLog
+from qgis.PyQt.QtCore import QSettings
+
+LOG_TAG = "PolygonNodesToDMS"
+# Directory profile stats are written to, profiling is off if empty
+SETTING_PROFILE_DIR = "PolygonNodesToDMS/profile_dir"
+# Held by the active profiler, only one cProfile profiler can be active in the process (Python >= 3.12)
+_PROFILER_LOCK = threading.Lock()
+
+
+class StageTimer:
+    """Measure duration of the stage and log it with number of processed vertices, e.g.:
+
+        with StageTimer("Generating nodes") as timer:
+            nodes = ...
+            timer.vertices = len(nodes)
+    """
+
+    def __init__(self, stage: str, vertices: int | None = None):
+        """
+        :param stage: stage name
+        :param vertices: number of vertices processed in the stage, can be set later inside with block
+        """
+        self.stage = stage
+        self.vertices = vertices
+        self.elapsed = 0.0
+        self._start = None
+
+    def __enter__(self) -> StageTimer:
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.elapsed = time.perf_counter() - self._start
+        message = f"{self.stage}: {self.elapsed:.3f} s"
+        if self.vertices is not None:
+            message += f", {self.vertices} vertices"
+        if exc_type is not None:
+            message += " (failed)"
+        QgsMessageLog.logMessage(message, LOG_TAG, level=Qgis.Info)
+
+
+class RunProfiler:
+    """Profile code in the with block with cProfile if PolygonNodesToDMS/profile_dir setting is set,
+    stats are dumped to <profile_dir>/<name>_<timestamp>.prof file. Only the thread which entered
+    the with block is profiled. Runs overlapping with the profiled run, e.g. canceled task still running
+    and the next task, are not profiled.
+    """
+
+    def __init__(self, name: str):
+        """
+        :param name: name of the profiled run, used in the stats file name
+        """
+        self.name = name
+        self.profile_dir = QSettings().value(SETTING_PROFILE_DIR, "", type=str)
+        self.profile = None
+
+    def __enter__(self) -> RunProfiler:
+        if not self.profile_dir:
+            return self
+        if not _PROFILER_LOCK.acquire(blocking=False):
+            QgsMessageLog.logMessage(
+                f"Run {self.name} not profiled, other run is being profiled", LOG_TAG, level=Qgis.Info
+            )
+            return self
+        self.profile = cProfile.Profile()
+        try:
+            self.profile.enable()
+        except ValueError as e:
+            # Profiler started outside the plugin
+            _PROFILER_LOCK.release()
+            self.profile = None
+            QgsMessageLog.logMessage(f"Run {self.name} not profiled: {e}", LOG_TAG, level=Qgis.Info)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if self.profile is None:
+            return
+        self.profile.disable()
+        _PROFILER_LOCK.release()
+        path = os.path.join(self.profile_dir, f'{self.name}_{datetime.now().strftime("%Y%m%d_%H%M%S_%f")}.prof')
+        try:
+            os.makedirs(self.profile_dir, exist_ok=True)
+            self.profile.dump_stats(path)
+        except OSError as e:
+            QgsMessageLog.logMessage(f"Can't write profile stats {path}: {e}", LOG_TAG, level=Qgis.Warning)
+            return
+        QgsMessageLog.logMessage(f"Profile stats written to {path}", LOG_TAG, level=Qgis.Info)
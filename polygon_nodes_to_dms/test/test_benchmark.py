@@ -0,0 +1,175 @@
+# coding=utf-8
+"""Node generation pipeline benchmark.
+
+Benchmark is skipped unless POLYGON_NODES_BENCHMARK environment variable is set to the path of the JSON file
+the results are written to, e.g.:
+
+    POLYGON_NODES_BENCHMARK=benchmark.json QT_QPA_PLATFORM=offscreen make test
+
+Each stage of the pipeline is timed separately for synthetic polygon and multipolygon layers
+with 10^2 to 10^6 vertices, results of the releases can be compared to find performance regressions.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import json
+import math
+import os
+import platform
+import random
+import time
+import unittest
+from contextlib import contextmanager
+
+from qgis.core import (
+    Qgis,
+    QgsFeature,
+    QgsGeometry,
+    QgsLineString,
+    QgsMultiPolygon,
+    QgsPolygon
+)
+
+from ..coordinate_format import ORDER_XY, format_dms
+from ..lod import coordinate_levels
+from ..nodes import geometry_coordinates, node_features, node_levels
+from ..output_layer import OutputLayer, node_fields
+from .utilities import get_qgis_app
+
+QGIS_APP, CANVAS, IFACE, PARENT = get_qgis_app()
+
+BENCHMARK_OUTPUT = os.environ.get("POLYGON_NODES_BENCHMARK")
+VERTEX_COUNTS = (10 ** 2, 10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6)
+# Maximum number of vertices of one synthetic feature, larger layers have more features
+FEATURE_VERTICES = 10000
+# Number of parts of one synthetic multipolygon feature
+MULTIPOLYGON_PARTS = 10
+
+
+def synthetic_ring(center_x, center_y, radius, vertices, rnd):
+    """Return closed ring with vertices on the jagged circle, ring closing vertex included in vertices count."""
+    xs = []
+    ys = []
+    for i in range(vertices - 1):
+        angle = 2 * math.pi * i / (vertices - 1)
+        r = radius * (1 + 0.1 * rnd.random())
+        xs.append(center_x + r * math.cos(angle))
+        ys.append(center_y + r * math.sin(angle))
+    xs.append(xs[0])
+    ys.append(ys[0])
+    return QgsLineString(xs, ys)
+
+
+def synthetic_features(vertices, multipolygon, seed=0):
+    """Return features with vertices in total, polygons or multipolygons in WGS84 around central Europe."""
+    rnd = random.Random(seed)
+    features = []
+    remaining = vertices
+    while remaining > 0:
+        feature_vertices = min(remaining, FEATURE_VERTICES)
+        remaining -= feature_vertices
+        center_x = rnd.uniform(14.0, 24.0)
+        center_y = rnd.uniform(49.0, 55.0)
+        if multipolygon:
+            parts = min(MULTIPOLYGON_PARTS, feature_vertices // 4)
+            geom = QgsMultiPolygon()
+            for part in range(parts):
+                polygon = QgsPolygon()
+                polygon.setExteriorRing(
+                    synthetic_ring(center_x + part * 0.5, center_y, 0.2, feature_vertices // parts, rnd)
+                )
+                geom.addGeometry(polygon)
+        else:
+            geom = QgsPolygon()
+            geom.setExteriorRing(synthetic_ring(center_x, center_y, 0.5, feature_vertices, rnd))
+        feature = QgsFeature(len(features))
+        feature.setGeometry(QgsGeometry(geom))
+        features.append(feature)
+    return features
+
+
+@contextmanager
+def stage(timings, name):
+    """Store duration of the with block in seconds as timings[name]."""
+    start = time.perf_counter()
+    yield
+    timings[name] = time.perf_counter() - start
+
+
+def benchmark_pipeline(features):
+    """Time stages of node generation for the features, return stage name -> duration in seconds."""
+    timings = {}
+    fields = node_fields()
+
+    with stage(timings, "vertex_extraction"):
+        coords = [geometry_coordinates(feature.geometry()) for feature in features]
+    with stage(timings, "importance_levels"):
+        for feature_coords in coords:
+            node_levels(feature_coords)
+    with stage(timings, "importance_levels_python"):
+        for feature_coords in coords:
+            coordinate_levels(feature_coords)
+    with stage(timings, "dms_formatting"):
+        for feature_coords in coords:
+            format_dms(feature_coords.xs, feature_coords.ys, ORDER_XY)
+    with stage(timings, "node_features"):
+        node_feats = list(node_features(features, fields, ORDER_XY))
+    with stage(timings, "node_features_without_levels"):
+        list(node_features(features, fields, ORDER_XY, with_levels=False))
+
+    output_layer = OutputLayer(IFACE)
+    output_layer.create()
+    # Production path: batched insertion, extent update and spatial index
+    with stage(timings, "add_nodes"):
+        output_layer.add_nodes(node_feats)
+    with stage(timings, "labeling_setup"):
+        output_layer.set_labels()
+
+    timings["nodes"] = len(node_feats)
+    return timings
+
+
+@unittest.skipUnless(BENCHMARK_OUTPUT, "set POLYGON_NODES_BENCHMARK to the results file path to run benchmark")
+class NodesPipelineBenchmark(unittest.TestCase):
+    """Benchmark node generation pipeline stages."""
+
+    def test_benchmark(self):
+        """Time pipeline stages for synthetic layers and write results to the JSON file."""
+        results = {
+            "qgis_version": Qgis.QGIS_VERSION,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "cases": []
+        }
+        for multipolygon in (False, True):
+            for vertices in VERTEX_COUNTS:
+                features = synthetic_features(vertices, multipolygon)
+                timings = benchmark_pipeline(features)
+                nodes_count = timings.pop("nodes")
+                self.assertEqual(
+                    nodes_count,
+                    sum(feature.geometry().constGet().nCoordinates() for feature in features)
+                )
+                results["cases"].append({
+                    "geometry": "multipolygon" if multipolygon else "polygon",
+                    "vertices": nodes_count,
+                    "features": len(features),
+                    "stages": timings
+                })
+
+        with open(BENCHMARK_OUTPUT, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(NodesPipelineBenchmark)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,104 @@
+# coding=utf-8
+"""Command line converter test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import contextlib
+import csv
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from .. import cli
+from ..coordinate_format import ORDER_YX
+from .utilities import get_qgis_app
+
+QGIS_APP, CANVAS, IFACE, PARENT = get_qgis_app()
+
+# Square polygon with 5 nodes, ring closing node included
+SQUARE_GEOJSON = {
+    "type": "FeatureCollection",
+    "features": [{
+        "type": "Feature",
+        "properties": {},
+        "geometry": {"type": "Polygon", "coordinates": [[[21.0, 52.0], [21.5, 52.0], [21.5, 52.5], [21.0, 52.0]]]}
+    }]
+}
+
+
+class CliTest(unittest.TestCase):
+    """Test files are converted and errors of one file do not stop the others."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.input_path = os.path.join(self.directory.name, 'sectors.geojson')
+        with open(self.input_path, 'w', encoding='utf-8') as f:
+            json.dump(SQUARE_GEOJSON, f)
+        # Test QGIS application is used, converter must not start nor exit its own
+        patcher = mock.patch.object(cli, 'init_qgis')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.directory.cleanup()
+
+    def test_csv(self):
+        """Test nodes are written to CSV file with coordinates and formatted coordinates."""
+        output_file = os.path.join(self.directory.name, 'nodes.csv')
+        count = cli.convert_file(self.input_path, output_file, 'csv', ORDER_YX, 0)
+        self.assertEqual(count, 4)
+        with open(output_file, newline='', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 4)
+        self.assertEqual((float(rows[1]['x']), float(rows[1]['y'])), (21.5, 52.0))
+        self.assertEqual(rows[1][cli.FIELD_NAME], '52°0′0″N,21°30′0″E')
+
+    def test_geojson(self):
+        """Test nodes are written to GeoJSON feature collection with all node fields."""
+        output_file = os.path.join(self.directory.name, 'nodes.geojson')
+        cli.convert_file(self.input_path, output_file, 'geojson', ORDER_YX, 0)
+        with open(output_file, encoding='utf-8') as f:
+            collection = json.load(f)
+        self.assertEqual(len(collection['features']), 4)
+        feature = collection['features'][2]
+        self.assertEqual(feature['geometry']['coordinates'], [21.5, 52.5])
+        self.assertEqual(feature['properties'][cli.FIELD_VERTEX], 2)
+        self.assertEqual(feature['properties'][cli.FIELD_NAME], '52°30′0″N,21°30′0″E')
+
+    def test_bad_file_does_not_stop_batch(self):
+        """Test any error of one file is reported and other files are converted."""
+        bad_path = os.path.join(self.directory.name, 'bad.geojson')
+        convert_file = cli.convert_file
+
+        def fail_bad_file(input_path, *args):
+            if input_path == bad_path:
+                raise RuntimeError('corrupt geometry')
+            return convert_file(input_path, *args)
+
+        stderr = io.StringIO()
+        with mock.patch.object(cli, 'convert_file', fail_bad_file), contextlib.redirect_stderr(stderr), \
+                contextlib.redirect_stdout(io.StringIO()):
+            exit_code = cli.main([bad_path, self.input_path, '--output-dir', self.directory.name])
+        self.assertEqual(exit_code, 1)
+        self.assertIn('corrupt geometry', stderr.getvalue())
+        self.assertTrue(os.path.exists(os.path.join(self.directory.name, 'sectors_nodes_dms.csv')))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(CliTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,180 @@
+# coding=utf-8
+"""Coordinate formatting test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import random
+import unittest
+
+try:
+    from qgis.core import QgsCoordinateFormatter, QgsPointXY
+    from qgis.PyQt.QtCore import QLocale
+except ImportError:
+    QgsCoordinateFormatter = None
+
+from coordinate_format import (
+    FORMAT_COMPACT,
+    FORMAT_DD,
+    FORMAT_DDM,
+    FORMAT_DMS,
+    ORDER_XY,
+    ORDER_YX,
+    DMSCache,
+    compile_format,
+    format_coordinates,
+    format_dms
+)
+
+
+class CoordinateFormatTest(unittest.TestCase):
+    """Test coordinates are formatted in DMS format."""
+
+    def test_order(self):
+        """Test coordinate order."""
+        self.assertEqual(
+            format_dms([21.5], [52.25], ORDER_XY),
+            ['21°30′0.000″E,52°15′0.000″N']
+        )
+        self.assertEqual(
+            format_dms([21.5], [52.25], ORDER_YX),
+            ['52°15′0.000″N,21°30′0.000″E']
+        )
+
+    def test_hemispheres(self):
+        """Test hemisphere letters."""
+        self.assertEqual(
+            format_dms([-0.5, 0.0, 180.0, -180.0], [-0.25, 0.0, 90.0, -90.0]),
+            [
+                '0°30′0.000″W,0°15′0.000″S',
+                '0°0′0.000″,0°0′0.000″',
+                '180°0′0.000″,90°0′0.000″N',
+                '180°0′0.000″,90°0′0.000″S'
+            ]
+        )
+
+    def test_wrapping(self):
+        """Test longitude and latitude out of range are wrapped."""
+        self.assertEqual(format_dms([190.0], [110.0]), ['170°0′0.000″W,70°0′0.000″S'])
+
+    def test_seconds_rounding(self):
+        """Test seconds rounded to 60 are carried over to minutes and degrees."""
+        self.assertEqual(format_dms([10.9999999], [0.0]), ['11°0′0.000″E,0°0′0.000″'])
+        self.assertEqual(format_dms([10.0001], [0.0], precision=1), ['10°0′0.4″E,0°0′0.0″'])
+
+    def test_cache(self):
+        """Test cached coordinates are not formatted again and cache size is bounded."""
+        cache = DMSCache(maxsize=2)
+        self.assertEqual(
+            cache.format_dms([21.5, 21.5], [52.25, 52.25], ORDER_YX),
+            ['52°15′0.000″N,21°30′0.000″E', '52°15′0.000″N,21°30′0.000″E']
+        )
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+        self.assertEqual(cache.format_dms([21.5, 1.0], [52.25, 1.0], ORDER_YX)[0], '52°15′0.000″N,21°30′0.000″E')
+        self.assertEqual((cache.hits, cache.misses), (1, 3))
+        cache.format_dms([2.0], [2.0], ORDER_YX)
+        self.assertEqual((cache.hits, cache.misses), (1, 4))
+        self.assertEqual(len(cache), 2)
+        cache.clear()
+        self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_cache_bypassed(self):
+        """Test more coordinates than cache size are formatted without the cache."""
+        cache = DMSCache(maxsize=2)
+        cache.format_dms([21.5], [52.25])
+        xs = [21.5, 1.0, 2.0]
+        ys = [52.25, 1.0, 2.0]
+        self.assertEqual(cache.format_dms(xs, ys), format_dms(xs, ys))
+        self.assertEqual((len(cache), cache.hits, cache.misses), (1, 0, 4))
+
+    def test_cache_formats(self):
+        """Test coordinates formatted in different formats are cached separately."""
+        cache = DMSCache()
+        cache.format_dms([21.5], [52.25], ORDER_YX)
+        self.assertEqual(cache.format_dms([21.5], [52.25], ORDER_YX, 2, FORMAT_COMPACT), ['521500.00N 0213000.00E'])
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+
+@unittest.skipIf(QgsCoordinateFormatter is None, "QGIS is not available")
+class QgsCoordinateFormatterTest(unittest.TestCase):
+    """Test DMS coordinates are formatted as QgsCoordinateFormatter does in the C locale."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.locale = QLocale()
+        QLocale.setDefault(QLocale.c())
+
+    def tearDown(self):
+        """Runs after each test."""
+        QLocale.setDefault(self.locale)
+
+    def test_random_coordinates(self):
+        """Test random coordinates, including out of range and rounded to the full minute or degree."""
+        rnd = random.Random(0)
+        xs = [rnd.uniform(-200.0, 200.0) for _ in range(500)] + [0.0, 180.0, -180.0, 10.9999999, -0.00000001]
+        ys = [rnd.uniform(-100.0, 100.0) for _ in range(500)] + [0.0, 90.0, -90.0, -1.9999999, 0.00000001]
+        for precision in range(7):
+            expected = [
+                QgsCoordinateFormatter.format(
+                    QgsPointXY(x, y), QgsCoordinateFormatter.FormatDegreesMinutesSeconds, precision
+                )
+                for x, y in zip(xs, ys)
+            ]
+            self.assertEqual(format_dms(xs, ys, ORDER_XY, precision), expected)
+            self.assertEqual(compile_format(FORMAT_DMS, ORDER_XY, precision)(xs, ys), expected)
+
+
+class CompiledFormatTest(unittest.TestCase):
+    """Test coordinates are formatted with compiled formats."""
+
+    def test_formats(self):
+        """Test all formats."""
+        expected = {
+            FORMAT_DMS: ['52°15′0.000″N,21°30′0.000″E', '33°30′0.000″S,70°40′30.000″W'],
+            FORMAT_DDM: ['52°15.000′N,21°30.000′E', '33°30.000′S,70°40.500′W'],
+            FORMAT_DD: ['52.250°N,21.500°E', '33.500°S,70.675°W'],
+            FORMAT_COMPACT: ['521500.000N 0213000.000E', '333000.000S 0704030.000W'],
+        }
+        for coord_format, formatted in expected.items():
+            self.assertEqual(format_coordinates([21.5, -70.675], [52.25, -33.5], ORDER_YX, 3, coord_format), formatted)
+
+    def test_dms_compatible(self):
+        """Test compiled DMS format is the same as format_dms."""
+        xs = [-179.123456, 0.0, 10.9999999, 190.0]
+        ys = [-89.987654, 0.0, 0.0001, 110.0]
+        self.assertEqual(compile_format(FORMAT_DMS, ORDER_XY, 2)(xs, ys), format_dms(xs, ys, ORDER_XY, 2))
+
+    def test_hemispheres(self):
+        """Test hemisphere letters of zero and antimeridian, compact format always has hemisphere letter."""
+        self.assertEqual(format_coordinates([0.0, 180.0], [0.0, 0.0], ORDER_XY, 1, FORMAT_DDM), ['0°0.0′,0°0.0′', '180°0.0′,0°0.0′'])
+        self.assertEqual(format_coordinates([-0.0001], [0.0001], ORDER_XY, 2, FORMAT_DD), ['0.00°,0.00°'])
+        self.assertEqual(format_coordinates([0.0], [-0.5], ORDER_XY, 0, FORMAT_COMPACT), ['0000000E 003000S'])
+
+    def test_rounding(self):
+        """Test minutes and seconds rounded to 60 are carried over."""
+        self.assertEqual(format_coordinates([10.9999999], [0.0], ORDER_XY, 3, FORMAT_DDM), ['11°0.000′E,0°0.000′'])
+        self.assertEqual(format_coordinates([10.9999999], [-1.9999999], ORDER_XY, 2, FORMAT_COMPACT), ['0110000.00E 020000.00S'])
+
+    def test_compiled_once(self):
+        """Test format is compiled once for the same format, order and precision."""
+        self.assertIs(compile_format(FORMAT_DD, ORDER_XY, 4), compile_format(FORMAT_DD, ORDER_XY, 4))
+        with self.assertRaises(ValueError):
+            compile_format('DMSH', ORDER_XY, 3)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite([
+        unittest.makeSuite(CoordinateFormatTest),
+        unittest.makeSuite(QgsCoordinateFormatterTest),
+        unittest.makeSuite(CompiledFormatTest)
+    ])
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,54 @@
+# coding=utf-8
+"""Level of detail test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import unittest
+
+from lod import MAX_LEVEL, coordinate_levels, importance_levels
+from wkb import PolygonCoordinates
+
+
+class LevelOfDetailTest(unittest.TestCase):
+    """Test importance levels of the ring nodes."""
+
+    def test_square_with_small_notch(self):
+        """Test corners are more important than small notch and collinear node."""
+        xs = [0.0, 1.0, 2.0, 2.0, 1.0, 1.0, 0.0, 0.0]
+        ys = [0.0, 0.0, 0.0, 2.0, 2.0, 1.9, 2.0, 0.0]
+        levels = importance_levels(xs, ys)
+        self.assertEqual(levels[0], 0)
+        self.assertEqual(levels[2], 0)
+        self.assertEqual(levels[3], 0)
+        self.assertEqual(levels[6], 0)
+        self.assertEqual(levels[-1], 0)
+        # Notch 0.1 deep
+        self.assertEqual(levels[5], 4)
+        self.assertEqual(levels[4], 4)
+        # Collinear node
+        self.assertEqual(levels[1], MAX_LEVEL)
+
+    def test_coordinate_levels(self):
+        """Test levels of the rings nodes are computed ring by ring."""
+        xs = [0.0, 1.0, 2.0, 0.0, 0.0, 0.5, 1.0, 0.0]
+        ys = [0.0, 0.0, 2.0, 0.0, 0.0, 0.0, 1.0, 0.0]
+        coords = PolygonCoordinates(xs, ys, [0] * 8, [0] * 4 + [1] * 4, [0, 1, 2, 3] * 2, [(0, 4), (4, 8)])
+        self.assertEqual(
+            list(coordinate_levels(coords)),
+            importance_levels(xs[:4], ys[:4]) + importance_levels(xs[4:], ys[4:])
+        )
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(LevelOfDetailTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,118 @@
+# coding=utf-8
+"""Nodes cache test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import itertools
+import os
+import sqlite3
+import struct
+import tempfile
+import unittest
+from array import array
+from unittest import mock
+
+from ..node_cache import NodeCache
+from ..wkb import decode_polygon_wkb
+
+
+def square_wkb(size):
+    """Return WKB of the square polygon."""
+    return struct.pack('<BIII', 1, 3, 1, 5) + struct.pack('<10d', 0, 0, size, 0, size, size, 0, size, 0, 0)
+
+
+class NodeCacheTest(unittest.TestCase):
+    """Test nodes are cached until geometry changes."""
+
+    def setUp(self):
+        """Runs before each test."""
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'nodes.sqlite')
+
+    def tearDown(self):
+        """Runs after each test."""
+        self.directory.cleanup()
+
+    def test_cached_until_geometry_changes(self):
+        """Test cached nodes are returned for the same geometry, order, precision and format only."""
+        wkb = square_wkb(1)
+        coords = decode_polygon_wkb(wkb)
+        dms = [f'node {i}' for i in range(len(coords.xs))]
+        with NodeCache(self.path) as cache:
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 3))
+            cache.put('layer', 1, wkb, 'XY', 3, 'DMS', coords, [0, 1, 0, 1, 0], dms)
+
+        with NodeCache(self.path) as cache:
+            cached_coords, levels, cached_dms = cache.get('layer', 1, wkb, 'XY', 3)
+            self.assertEqual(cached_coords.xs, coords.xs)
+            self.assertEqual(cached_coords.ys, coords.ys)
+            self.assertEqual(cached_coords.vertices, coords.vertices)
+            self.assertEqual(levels, array('i', [0, 1, 0, 1, 0]))
+            self.assertEqual(cached_dms, dms)
+            self.assertIsNone(cache.get('layer', 1, square_wkb(2), 'XY', 3))
+            self.assertIsNone(cache.get('layer', 1, wkb, 'YX', 3))
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 2))
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 3, 'DD'))
+            self.assertIsNone(cache.get('other', 1, wkb, 'XY', 3))
+            self.assertEqual((cache.hits, cache.misses), (1, 5))
+
+            cache.clear()
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 3))
+
+    def test_cached_without_levels(self):
+        """Test nodes cached without levels are used only if levels are not needed."""
+        wkb = square_wkb(1)
+        coords = decode_polygon_wkb(wkb)
+        dms = [f'node {i}' for i in range(len(coords.xs))]
+        with NodeCache(self.path) as cache:
+            cache.put('layer', 1, wkb, 'XY', 3, 'DMS', coords, array('i'), dms)
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 3))
+            _, levels, cached_dms = cache.get('layer', 1, wkb, 'XY', 3, with_levels=False)
+            self.assertEqual(levels, array('i', [0, 0, 0, 0, 0]))
+            self.assertEqual(cached_dms, dms)
+
+    def test_least_recently_used_evicted(self):
+        """Test least recently used features above max_features are removed when cache is closed."""
+        wkb = square_wkb(1)
+        coords = decode_polygon_wkb(wkb)
+        dms = [f'node {i}' for i in range(len(coords.xs))]
+        with mock.patch(f'{NodeCache.__module__}.time.time', side_effect=itertools.count()):
+            with NodeCache(self.path, max_features=2) as cache:
+                for feature_id in range(3):
+                    cache.put('layer', feature_id, wkb, 'XY', 3, 'DMS', coords, array('i'), dms)
+                # Feature 0 is used after feature 1
+                self.assertIsNotNone(cache.get('layer', 0, wkb, 'XY', 3, with_levels=False))
+
+        with NodeCache(self.path, max_features=2) as cache:
+            self.assertIsNotNone(cache.get('layer', 0, wkb, 'XY', 3, with_levels=False))
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 3, with_levels=False))
+            self.assertIsNotNone(cache.get('layer', 2, wkb, 'XY', 3, with_levels=False))
+            self.assertEqual(cache.evict(), 0)
+
+    def test_old_cache_replaced(self):
+        """Test cache table created by the previous version is created again."""
+        connection = sqlite3.connect(self.path)
+        connection.execute("CREATE TABLE feature_nodes (source TEXT)")
+        connection.execute("INSERT INTO feature_nodes VALUES ('layer')")
+        connection.commit()
+        connection.close()
+        wkb = square_wkb(1)
+        coords = decode_polygon_wkb(wkb)
+        with NodeCache(self.path) as cache:
+            self.assertIsNone(cache.get('layer', 1, wkb, 'XY', 3))
+            cache.put('layer', 1, wkb, 'XY', 3, 'DMS', coords, array('i'), ['node'] * len(coords.xs))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(NodeCacheTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,46 @@
+# coding=utf-8
+"""Node index test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import unittest
+
+from node_index import NodeIndex
+
+
+class NodeIndexTest(unittest.TestCase):
+    """Test shared nodes are merged."""
+
+    def test_identical_nodes(self):
+        """Test identical nodes are merged and owners are listed once."""
+        index = NodeIndex()
+        self.assertEqual(index.add(1.0, 2.0, 1), 0)
+        self.assertEqual(index.add(1.0, 2.0, 1), 0)
+        self.assertEqual(index.add(1.0, 2.0, 2), 0)
+        self.assertEqual(index.add(1.0, 2.000001, 2), 1)
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.owners, [[1, 2], [2]])
+
+    def test_tolerance(self):
+        """Test nodes within tolerance are merged, also across grid cells."""
+        index = NodeIndex(tolerance=0.001)
+        self.assertEqual(index.add(0.0099995, 5.0, 1), 0)
+        self.assertEqual(index.add(0.0100004, 5.0005, 2), 0)
+        self.assertEqual(index.add(0.0120000, 5.0, 3), 1)
+        self.assertEqual(index.xs, [0.0099995, 0.012])
+        self.assertEqual(index.owners, [[1, 2], [3]])
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(NodeIndexTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,134 @@
+# coding=utf-8
+"""Plugin startup test - plugin load must not build the dialog, output layers registry nor parse the .ui file,
+modules generating nodes are imported when plugin is run.
+
+Startup benchmark is skipped unless POLYGON_NODES_STARTUP_BENCHMARK environment variable is set to the path
+of the JSON file the results are written to, e.g.:
+
+    POLYGON_NODES_STARTUP_BENCHMARK=startup.json QT_QPA_PLATFORM=offscreen make test
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import importlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import unittest
+
+from qgis.core import Qgis
+from qgis.PyQt import uic
+
+from .. import polygon_nodes_to_dms_dialog_base
+from ..polygon_nodes_to_dms import PolygonNodesToDMS
+from .utilities import get_qgis_app
+
+QGIS_APP, CANVAS, IFACE, PARENT = get_qgis_app()
+
+BENCHMARK_OUTPUT = os.environ.get("POLYGON_NODES_STARTUP_BENCHMARK")
+UI_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'polygon_nodes_to_dms_dialog_base.ui')
+REPEAT = 20
+# Modules imported when plugin is run, not when it is loaded
+LAZY_MODULES = (
+    'nodes', 'nodes_task', 'output_layer', 'label_settings', 'polygon_nodes_to_dms_dialog',
+    'polygon_nodes_to_dms_dialog_base'
+)
+# Loads plugin in new Python process and prints names of the imported modules
+STARTUP_SCRIPT = """
+import sys
+from unittest import mock
+
+from qgis.testing import start_app
+
+start_app()
+from {package}.polygon_nodes_to_dms import PolygonNodesToDMS
+
+iface = mock.MagicMock()
+iface.mainWindow.return_value = None
+PolygonNodesToDMS(iface).initGui()
+print("modules:", " ".join(sys.modules))
+"""
+
+
+def best_time(func):
+    """Return the shortest of REPEAT func execution times in seconds."""
+    times = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+class PluginStartupTest(unittest.TestCase):
+    """Test plugin is loaded lazily."""
+
+    def test_nothing_created_on_load(self):
+        """Test dialog, output layers registry and translator are not created when plugin is loaded."""
+        dialog_module = PolygonNodesToDMS.__module__.rsplit('.', 1)[0] + '.polygon_nodes_to_dms_dialog'
+        sys.modules.pop(dialog_module, None)
+        plugin = PolygonNodesToDMS(IFACE)
+        self.assertIsNone(plugin.dlg)
+        self.assertIsNone(plugin.output_layers)
+        self.assertIsNone(plugin.translator)
+        self.assertNotIn(dialog_module, sys.modules)
+
+    def test_modules_not_imported_on_init_gui(self):
+        """Test modules generating nodes are not imported when plugin is loaded and its GUI initialized.
+        Plugin is loaded in new process, modules imported by other tests are not in its sys.modules.
+        """
+        package = PolygonNodesToDMS.__module__.rsplit('.', 1)[0]
+        package_parent_dir = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [package_parent_dir, env.get('PYTHONPATH')]))
+        result = subprocess.run(
+            [sys.executable, '-c', STARTUP_SCRIPT.format(package=package)],
+            cwd=package_parent_dir, env=env, capture_output=True, text=True, check=True
+        )
+        modules_line = [line for line in result.stdout.splitlines() if line.startswith('modules:')][-1]
+        modules = set(modules_line.split()[1:])
+        self.assertIn(f'{package}.nodes_provider', modules)
+        for name in LAZY_MODULES:
+            self.assertNotIn(f'{package}.{name}', modules)
+
+
+@unittest.skipUnless(
+    BENCHMARK_OUTPUT, "set POLYGON_NODES_STARTUP_BENCHMARK to the results file path to run benchmark"
+)
+class PluginStartupBenchmark(unittest.TestCase):
+    """Benchmark plugin startup."""
+
+    def test_benchmark(self):
+        """Time plugin construction and UI loading and write results to the JSON file."""
+        results = {
+            "qgis_version": Qgis.QGIS_VERSION,
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "stages": {
+                "plugin_construction": best_time(lambda: PolygonNodesToDMS(IFACE)),
+                "ui_file_load": best_time(lambda: uic.loadUiType(UI_PATH)),
+                "compiled_ui_load": best_time(lambda: importlib.reload(polygon_nodes_to_dms_dialog_base))
+            }
+        }
+        with open(BENCHMARK_OUTPUT, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    suite = unittest.TestSuite([
+        unittest.makeSuite(PluginStartupTest),
+        unittest.makeSuite(PluginStartupBenchmark)
+    ])
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
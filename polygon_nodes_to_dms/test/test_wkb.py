@@ -0,0 +1,79 @@
+# coding=utf-8
+"""WKB decoding test.
+
+.. note:: This program is free software; you can redistribute it and/or modify
+     it under the terms of the GNU General Public License as published by
+     the Free Software Foundation; either version 2 of the License, or
+     (at your option) any later version.
+
+"""
+
+__author__ = '@'
+__date__ = '2021-04-06'
+__copyright__ = 'Copyright 2021, Paweł Strzelewicz'
+
+import struct
+import unittest
+
+from wkb import decode_polygon_wkb
+
+SQUARE = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0), (0.0, 0.0)]
+HOLE = [(0.25, 0.25), (0.5, 0.25), (0.25, 0.5), (0.25, 0.25)]
+
+
+def polygon_wkb(rings, byte_order='<', wkb_type=3, extra=()):
+    """Return polygon WKB, extra are values of additional coordinate dimensions (Z, M) of each point."""
+    data = struct.pack(byte_order + 'BII', 1 if byte_order == '<' else 0, wkb_type, len(rings))
+    for ring in rings:
+        data += struct.pack(byte_order + 'I', len(ring))
+        for point in ring:
+            data += struct.pack(byte_order + 'd' * (2 + len(extra)), *point, *extra)
+    return data
+
+
+class WkbTest(unittest.TestCase):
+    """Test polygon/multipolygon WKB is decoded into coordinate arrays."""
+
+    def test_polygon(self):
+        """Test polygon with interior ring."""
+        coords = decode_polygon_wkb(polygon_wkb([SQUARE, HOLE]))
+        self.assertEqual(list(zip(coords.xs, coords.ys)), SQUARE + HOLE)
+        self.assertEqual(list(coords.parts), [0] * 9)
+        self.assertEqual(list(coords.rings), [0] * 5 + [1] * 4)
+        self.assertEqual(list(coords.vertices), [0, 1, 2, 3, 4, 0, 1, 2, 3])
+        self.assertEqual(coords.ring_slices, [(0, 5), (5, 9)])
+
+    def test_multipolygon_mixed_byte_order_z(self):
+        """Test multipolygon with big endian part and ISO Z coordinates."""
+        data = struct.pack('<BII', 1, 1006, 2)
+        data += polygon_wkb([SQUARE], '<', 1003, (7.0,))
+        data += polygon_wkb([HOLE], '>', 1003, (7.0,))
+        coords = decode_polygon_wkb(data)
+        self.assertEqual(list(zip(coords.xs, coords.ys)), SQUARE + HOLE)
+        self.assertEqual(list(coords.parts), [0] * 5 + [1] * 4)
+        self.assertEqual(list(coords.rings), [0] * 9)
+
+    def test_ewkb_srid_zm(self):
+        """Test EWKB polygon with SRID, Z and M coordinates."""
+        # Header with SRID followed by the rings of the plain polygon WKB
+        data = struct.pack('<BIII', 1, 3 | 0x80000000 | 0x40000000 | 0x20000000, 4326, 1)
+        data += polygon_wkb([SQUARE], extra=(1.0, 2.0))[9:]
+        coords = decode_polygon_wkb(data)
+        self.assertEqual(list(zip(coords.xs, coords.ys)), SQUARE)
+
+    def test_null_geometry(self):
+        """Test empty WKB of the null geometry has no nodes."""
+        for data in (b'', bytearray(), memoryview(b'')):
+            coords = decode_polygon_wkb(data)
+            self.assertEqual((len(coords.xs), len(coords.parts), coords.ring_slices), (0, 0, []))
+
+    def test_unsupported_type(self):
+        """Test curve polygon is not decoded."""
+        with self.assertRaises(ValueError):
+            decode_polygon_wkb(polygon_wkb([SQUARE], wkb_type=10))
+
+
+if __name__ == "__main__":
+    suite = unittest.makeSuite(WkbTest)
+    runner = unittest.TextTestRunner(verbosity=2)
+    runner.run(suite)
@@ -0,0 +1,229 @@
+"""Generating nodes only in the visible part of the map canvas."""
+from __future__ import annotations
+
+import math
+from array import array
+from typing import Iterable, Iterator, NamedTuple
+
+from qgis.core import (
+    Qgis,
+    QgsCoordinateTransform,
+    QgsExpression,
+    QgsFeature,
+    QgsFeatureRequest,
+    QgsGeometry,
+    QgsProject,
+    QgsRectangle,
+    QgsVectorLayer
+)
+from qgis.gui import QgisInterface
+from qgis.PyQt.QtCore import QTimer
+
+from .coordinate_format import FORMAT_DMS, DMSCache
+from .crs_transform import WGS84, to_wgs84, wgs84_transform
+from .nodes import coordinate_node_features, coordinates_formatter, geometry_coordinates, node_levels
+from .output_layer import FIELD_FEATURE_ID, OutputLayer, node_fields
+from .wkb import PolygonCoordinates
+
+# Delay after the last extent change before nodes are generated, ms
+DEBOUNCE_INTERVAL = 300
+# Visible extent is enlarged by this fraction of its size on each side
+EXTENT_MARGIN = 0.1
+# Nodes are not generated if visible extent covers more tiles
+MAX_TILES = 64
+
+
+class FeatureNodes(NamedTuple):
+    """Nodes of the source feature grouped by tiles."""
+    coords: PolygonCoordinates
+    # Importance levels are not computed in viewport mode, all nodes have level 0
+    levels: array
+    # Tile x, y indices -> indices of the nodes inside the tile
+    tiles: dict[tuple[int, int], list[int]]
+
+
+class ViewportNodesGenerator:
+    """Generate nodes of the selected features only inside the visible map extent.
+    Nodes are generated in square tiles in WGS84 coordinates, the same as coordinates of the nodes.
+    Tile size is set when generator starts, based on the visible extent. Tiles already generated are not generated
+    again when map is panned or zoomed.
+    Geometry of the feature is decoded and its nodes grouped by tiles once, when the first tile intersecting
+    the feature is generated, next tiles format only their nodes.
+    """
+
+    def __init__(self,
+                 iface: QgisInterface,
+                 src_layer: QgsVectorLayer,
+                 feature_ids: Iterable[int],
+                 output_layer: OutputLayer,
+                 coord_order: str,
+                 cache: DMSCache | None = None,
+                 precision: int = 3,
+                 coord_format: str = FORMAT_DMS):
+        """
+        :param iface: QGIS interface
+        :param src_layer: source polygon layer
+        :param feature_ids: ids of the features for which nodes are generated
+        :param output_layer: output layer, must be set up
+        :param coord_order: coordinate order used in DMS string, ORDER_XY or ORDER_YX
+        :param cache: cache of formatted coordinates
+        :param precision: number of decimal places of the last format component
+        :param coord_format: coordinate format, one of coordinate_format.FORMATS
+        """
+        self.iface = iface
+        self.canvas = iface.mapCanvas()
+        self.src_layer = src_layer
+        self.feature_ids = list(feature_ids)
+        self.output_layer = output_layer
+        self.format_func = coordinates_formatter(coord_order, precision, coord_format, cache)
+        self.fields = node_fields()
+        self.transform = wgs84_transform(src_layer.crs(), QgsProject.instance().transformContext())
+        self.generated_tiles = set()
+        self.tile_size = None
+        # Source feature id -> FeatureNodes
+        self.feature_nodes = {}
+
+        self.timer = QTimer()
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(DEBOUNCE_INTERVAL)
+        self.timer.timeout.connect(self.update)
+        self.canvas.extentsChanged.connect(self.timer.start)
+        self.src_layer.geometryChanged.connect(self.on_geometry_changed)
+        self.src_layer.willBeDeleted.connect(self.stop)
+        # Output layer removed from the project, stop is safe to call again
+        self.output_layer.layer.willBeDeleted.connect(self.stop)
+
+    def stop(self) -> None:
+        """Stop generating nodes on map extent changes."""
+        self.timer.stop()
+        self.feature_nodes = {}
+        try:
+            self.canvas.extentsChanged.disconnect(self.timer.start)
+            self.src_layer.geometryChanged.disconnect(self.on_geometry_changed)
+            self.src_layer.willBeDeleted.disconnect(self.stop)
+        except (RuntimeError, TypeError):
+            # Source layer already deleted
+            pass
+
+    def on_geometry_changed(self, fid: int, geom: QgsGeometry) -> None:
+        """Replace nodes of the edited feature in the tiles already generated, other tiles get nodes
+        of the new geometry when they are generated.
+        """
+        if fid not in self.feature_nodes:
+            # No nodes of the feature generated yet
+            return
+        layer = self.output_layer.layer
+        request = (
+            QgsFeatureRequest()
+            .setFilterExpression(QgsExpression.createFieldEqualityExpression(FIELD_FEATURE_ID, fid))
+            .setNoAttributes()
+            .setFlags(QgsFeatureRequest.NoGeometry)
+        )
+        layer.dataProvider().deleteFeatures([feature.id() for feature in layer.getFeatures(request)])
+
+        feature = QgsFeature(fid)
+        feature.setGeometry(QgsGeometry(geom))
+        nodes = self.group_nodes(feature)
+        self.feature_nodes[fid] = nodes
+        for tile in self.generated_tiles.intersection(nodes.tiles):
+            self.output_layer.add_nodes(self.tile_node_features(tile, [fid]))
+        layer.triggerRepaint()
+
+    def visible_extent(self) -> QgsRectangle:
+        """Return visible map extent with margin in WGS84 coordinates."""
+        transform = QgsCoordinateTransform(self.canvas.mapSettings().destinationCrs(), WGS84, QgsProject.instance())
+        extent = transform.transformBoundingBox(self.canvas.extent())
+        extent.grow(max(extent.width(), extent.height()) * EXTENT_MARGIN)
+        return extent
+
+    def visible_tiles(self, extent: QgsRectangle) -> list[tuple[int, int]]:
+        """Return indices of the tiles covering extent."""
+        if self.tile_size is None:
+            # Power of 2 so that the tile grid does not depend on the floating point rounding
+            self.tile_size = 2.0 ** math.ceil(math.log2(max(extent.width(), extent.height(), 1e-9) / 2))
+        min_x, min_y = self.tile_key(extent.xMinimum(), extent.yMinimum())
+        max_x, max_y = self.tile_key(extent.xMaximum(), extent.yMaximum())
+        return [(tile_x, tile_y) for tile_x in range(min_x, max_x + 1) for tile_y in range(min_y, max_y + 1)]
+
+    def update(self) -> None:
+        """Generate nodes in visible tiles which were not generated yet."""
+        tiles = self.visible_tiles(self.visible_extent())
+        if len(tiles) > MAX_TILES:
+            self.iface.messageBar().pushMessage(
+                "PolygonNodesToDMS",
+                "Map extent too large to generate nodes in view, zoom in.",
+                level=Qgis.Warning,
+                duration=3
+            )
+            return
+
+        nodes_count = 0
+        for tile in tiles:
+            if tile in self.generated_tiles:
+                continue
+            nodes_count += self.generate_tile(tile)
+            self.generated_tiles.add(tile)
+
+        if nodes_count:
+            self.output_layer.layer.triggerRepaint()
+
+    def tile_key(self, x: float, y: float) -> tuple[int, int]:
+        """Return indices of the tile containing point x, y in WGS84."""
+        return math.floor(x / self.tile_size), math.floor(y / self.tile_size)
+
+    def group_nodes(self, feature: QgsFeature) -> FeatureNodes:
+        """Decode nodes of the feature and group them by tiles."""
+        coords = geometry_coordinates(to_wgs84(feature.geometry(), self.transform))
+        tiles = {}
+        for i, (x, y) in enumerate(zip(coords.xs, coords.ys)):
+            tiles.setdefault(self.tile_key(x, y), []).append(i)
+        return FeatureNodes(coords, node_levels(coords, with_levels=False), tiles)
+
+    def tile_feature_ids(self, tile: tuple[int, int]) -> list[int]:
+        """Return ids of the features which bounding boxes intersect the tile, decode nodes of the features
+        not decoded yet.
+        """
+        tile_x, tile_y = tile
+        filter_rect = QgsRectangle(
+            tile_x * self.tile_size,
+            tile_y * self.tile_size,
+            (tile_x + 1) * self.tile_size,
+            (tile_y + 1) * self.tile_size
+        )
+        if self.transform is not None:
+            filter_rect = self.transform.transformBoundingBox(filter_rect, QgsCoordinateTransform.ReverseTransform)
+        request = (
+            QgsFeatureRequest()
+            .setFilterFids(self.feature_ids)
+            .setFilterRect(filter_rect)
+            .setNoAttributes()
+            .setFlags(QgsFeatureRequest.NoGeometry)
+        )
+        feature_ids = [feature.id() for feature in self.src_layer.getFeatures(request)]
+        new_ids = [fid for fid in feature_ids if fid not in self.feature_nodes]
+        if new_ids:
+            request = QgsFeatureRequest().setFilterFids(new_ids).setNoAttributes()
+            for feature in self.src_layer.getFeatures(request):
+                self.feature_nodes[feature.id()] = self.group_nodes(feature)
+        return feature_ids
+
+    def tile_node_features(self, tile: tuple[int, int], feature_ids: list[int]) -> Iterator[QgsFeature]:
+        """Yield node features of the features inside the tile."""
+        for fid in feature_ids:
+            nodes = self.feature_nodes.get(fid)
+            indices = nodes.tiles.get(tile) if nodes else None
+            if not indices:
+                continue
+            xs = [nodes.coords.xs[i] for i in indices]
+            ys = [nodes.coords.ys[i] for i in indices]
+            yield from coordinate_node_features(
+                fid, nodes.coords, nodes.levels, self.format_func(xs, ys), self.fields, indices
+            )
+
+    def generate_tile(self, tile: tuple[int, int]) -> int:
+        """Generate nodes inside the tile.
+
+        :param tile: tile x, y indices
+        :return: number of generated nodes
+        """
+        return self.output_layer.add_nodes(self.tile_node_features(tile, self.tile_feature_ids(tile)))
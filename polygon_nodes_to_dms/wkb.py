@@ -0,0 +1,122 @@
+"""Decoding polygon/multipolygon WKB into coordinate arrays.
+
+All coordinates of the geometry are copied from the WKB buffer into contiguous arrays ring by ring,
+without creating Python object for each vertex.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from typing import NamedTuple
+
+WKB_POLYGON = 3
+WKB_MULTIPOLYGON = 6
+
+# Flags of the EWKB geometry types
+_EWKB_Z = 0x80000000
+_EWKB_M = 0x40000000
+_EWKB_SRID = 0x20000000
+
+_NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class PolygonCoordinates(NamedTuple):
+    """Coordinates of all polygon/multipolygon nodes with their location in the geometry.
+    Arrays are of the same length, n-th node is xs[n], ys[n] and it is vertices[n] vertex
+    of the rings[n] ring of the parts[n] part, ring 0 is exterior ring.
+    """
+    xs: array
+    ys: array
+    parts: array
+    rings: array
+    vertices: array
+    # Start, end index of each ring nodes in the arrays
+    ring_slices: list[tuple[int, int]]
+
+
+def _geometry_type(wkb_type: int) -> tuple[int, int]:
+    """Return 2D geometry type and number of coordinate dimensions of ISO or EWKB geometry type."""
+    dimensions = 2
+    if wkb_type & (_EWKB_Z | _EWKB_M | _EWKB_SRID):
+        dimensions += bool(wkb_type & _EWKB_Z) + bool(wkb_type & _EWKB_M)
+        return wkb_type & ~(_EWKB_Z | _EWKB_M | _EWKB_SRID), dimensions
+    # ISO: 1000 - Z, 2000 - M, 3000 - ZM
+    dimensions += {0: 0, 1: 1, 2: 1, 3: 2}.get(wkb_type // 1000, 0)
+    return wkb_type % 1000, dimensions
+
+
+class _WkbReader:
+    """Sequential reader of the WKB buffer."""
+
+    def __init__(self, wkb: bytes | bytearray | memoryview):
+        self.buffer = memoryview(wkb).cast("B")
+        self.offset = 0
+
+    def header(self) -> tuple[str, int, int]:
+        """Read geometry header, return struct byte order, 2D geometry type, number of coordinate dimensions."""
+        byte_order = "<" if self.buffer[self.offset] == 1 else ">"
+        (wkb_type,) = struct.unpack_from(byte_order + "I", self.buffer, self.offset + 1)
+        self.offset += 5
+        if wkb_type & _EWKB_SRID:
+            self.offset += 4
+        geometry_type, dimensions = _geometry_type(wkb_type)
+        return byte_order, geometry_type, dimensions
+
+    def count(self, byte_order: str) -> int:
+        """Read number of rings, points or geometries."""
+        (value,) = struct.unpack_from(byte_order + "I", self.buffer, self.offset)
+        self.offset += 4
+        return value
+
+    def coordinates(self, byte_order: str, points: int, dimensions: int) -> array:
+        """Read coordinates of the points as flat array x0, y0, [z0, m0,] x1, y1, ..."""
+        size = points * dimensions * 8
+        coords = array("d")
+        coords.frombytes(self.buffer[self.offset:self.offset + size])
+        if (byte_order == "<") != _NATIVE_LITTLE_ENDIAN:
+            coords.byteswap()
+        self.offset += size
+        return coords
+
+
+def _read_polygon(reader: _WkbReader, part: int, result: PolygonCoordinates) -> None:
+    """Read polygon body and append its coordinates to result."""
+    byte_order, geometry_type, dimensions = reader.header()
+    if geometry_type != WKB_POLYGON:
+        raise ValueError(f"Unsupported WKB geometry type: {geometry_type}")
+    for ring in range(reader.count(byte_order)):
+        points = reader.count(byte_order)
+        coords = reader.coordinates(byte_order, points, dimensions)
+        start = len(result.xs)
+        result.xs.extend(coords[0::dimensions])
+        result.ys.extend(coords[1::dimensions])
+        result.parts.extend(array("i", [part]) * points)
+        result.rings.extend(array("i", [ring]) * points)
+        result.vertices.extend(array("i", range(points)))
+        result.ring_slices.append((start, start + points))
+
+
+def decode_polygon_wkb(wkb: bytes | bytearray | memoryview) -> PolygonCoordinates:
+    """Decode polygon/multipolygon WKB, ISO and EWKB flavours with Z, M coordinates are supported,
+    Z and M values are skipped.
+
+    :param wkb: polygon/multipolygon WKB, empty WKB of the null geometry has no nodes
+    :return: coordinates of the nodes with part, ring, vertex indices
+    :raise ValueError: if WKB is not polygon/multipolygon, e.g. curve polygon
+    """
+    result = PolygonCoordinates(array("d"), array("d"), array("i"), array("i"), array("i"), [])
+    if not len(wkb):
+        return result
+    reader = _WkbReader(wkb)
+    start = reader.offset
+    byte_order, geometry_type, _ = reader.header()
+    if geometry_type == WKB_POLYGON:
+        reader.offset = start
+        _read_polygon(reader, 0, result)
+    elif geometry_type == WKB_MULTIPOLYGON:
+        for part in range(reader.count(byte_order)):
+            _read_polygon(reader, part, result)
+    else:
+        raise ValueError(f"Unsupported WKB geometry type: {geometry_type}")
+    return result